@@ -6,22 +6,27 @@ Streamlit UI  |  Run: streamlit run app.py
 
 import io
 import os
+import copy
+import html
 import re
 import sys
 import json
 import time
+import importlib.util
+import textwrap
+from concurrent.futures import ThreadPoolExecutor, as_completed
+from functools import lru_cache, partial
 from pathlib import Path
 from datetime import datetime
 
-import anthropic
+import numpy as np
 import streamlit as st
+from streamlit.runtime.scriptrunner import add_script_run_ctx, get_script_run_ctx
 import pandas as pd
 
-try:
-    import pdf_filler as _pdf_filler
-    _PDF_FILL_AVAILABLE = True
-except Exception:
-    _PDF_FILL_AVAILABLE = False
+# anthropic and pdf_filler (PyMuPDF) are imported at their point of use so a
+# session that never chats or fills a PDF doesn't load them at startup
+_PDF_FILL_AVAILABLE = importlib.util.find_spec("fitz") is not None
 
 # ── Resolve paths regardless of CWD ──────────────────────────────────────────
 HERE = Path(__file__).parent.resolve()
@@ -30,9 +35,8 @@ sys.path.insert(0, str(HERE))
 
 from wealth_agent import (
     DATA_DIR, CLIENTS_DIR, MockSalesforce,
-    _fmt_money, _safe_float, _build_one_pager,
-    create_dummy_data, create_salesforce_contact,
-    find_client_file, list_excel_sheets, read_excel_sheet,
+    _fmt_money, _build_one_pager,
+    create_dummy_data, _create_contact, _find_client, _read_sheet,
 )
 
 # ── Brand constants ───────────────────────────────────────────────────────────
@@ -586,33 +590,43 @@ def _html_client_badge(name: str, has_excel: bool, has_registry: bool) -> None:
 """, unsafe_allow_html=True)
 
 
-def _html_callout(title_or_text: str, body_or_level: str = "info", level: str = "") -> None:
-    """
-    Two call signatures:
-      _html_callout("Title", "Body text", "info")   -- title + body
-      _html_callout("text with <strong>html</strong>", "info")  -- legacy
+_CALLOUT_STYLES = {
+    "info":    ("rgba(0,212,255,0.06)",   "#38BDF8", "rgba(0,212,255,0.3)",   "ℹ"),
+    "warning": ("rgba(245,158,11,0.06)",  "#F59E0B", "rgba(245,158,11,0.3)",  "⚠"),
+    "alert":   ("rgba(239,68,68,0.06)",   "#EF4444", "rgba(239,68,68,0.3)",   "🚨"),
+    "success": ("rgba(16,185,129,0.06)",  "#10B981", "rgba(16,185,129,0.3)",  "✓"),
+}
+
+
+def _callout_html(title_or_text: str, body_or_level: str = "info", level: str = "") -> str:
+    """Markup for one callout — same signatures as ``_html_callout``.
+
+    Use this to batch several callouts into a single ``st.markdown`` call.
     """
-    cfg = {
-        "info":    ("rgba(0,212,255,0.06)",   "#38BDF8", "rgba(0,212,255,0.3)",   "ℹ"),
-        "warning": ("rgba(245,158,11,0.06)",  "#F59E0B", "rgba(245,158,11,0.3)",  "⚠"),
-        "alert":   ("rgba(239,68,68,0.06)",   "#EF4444", "rgba(239,68,68,0.3)",   "🚨"),
-        "success": ("rgba(16,185,129,0.06)",  "#10B981", "rgba(16,185,129,0.3)",  "✓"),
-    }
     if level:
         # 3-arg form: title, body, level
         actual_level = level
         text = f"<strong>{title_or_text}</strong><br><span style='opacity:0.85;font-size:0.85em;'>{body_or_level}</span>"
     else:
-        actual_level = body_or_level if body_or_level in cfg else "info"
+        actual_level = body_or_level if body_or_level in _CALLOUT_STYLES else "info"
         text = title_or_text
-    bg, tc, border, icon = cfg.get(actual_level, cfg["info"])
-    st.markdown(f"""
+    bg, tc, border, icon = _CALLOUT_STYLES.get(actual_level, _CALLOUT_STYLES["info"])
+    return f"""
 <div style="background:{bg};border-left:3px solid {border};border-radius:0 8px 8px 0;
      padding:0.6rem 1rem;margin:0.4rem 0;font-size:0.875rem;color:{tc};
      backdrop-filter:blur(4px);">
   {icon}&nbsp; {text}
 </div>
-""", unsafe_allow_html=True)
+"""
+
+
+def _html_callout(title_or_text: str, body_or_level: str = "info", level: str = "") -> None:
+    """
+    Two call signatures:
+      _html_callout("Title", "Body text", "info")   -- title + body
+      _html_callout("text with <strong>html</strong>", "info")  -- legacy
+    """
+    st.markdown(_callout_html(title_or_text, body_or_level, level), unsafe_allow_html=True)
 
 
 def _html_stat_row(stats: list) -> None:
@@ -705,8 +719,26 @@ def _registry_names() -> list:
     return [r["name"] for r in _load_registry()]
 
 
+def _registry_stamp() -> int:
+    """Registry file mtime (ns), used as a cache key; 0 when absent."""
+    try:
+        return REGISTRY_PATH.stat().st_mtime_ns
+    except OSError:
+        return 0
+
+
+@lru_cache(maxsize=1)
+def _registry_index(stamp: int) -> dict:
+    """Lower-cased name → registry record; rebuilt only when the file changes."""
+    index = {}
+    for r in _load_registry():
+        index.setdefault(r["name"].lower(), r)
+    return index
+
+
 def _registry_entry(name: str):
-    return next((r for r in _load_registry() if r["name"].lower() == name.lower()), None)
+    """Registry record for ``name`` (or None), as a copy callers may mutate."""
+    return copy.deepcopy(_registry_index(_registry_stamp()).get(name.lower()))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -718,6 +750,54 @@ def _parse_date(val: str) -> str:
     return val.split()[0] if " " in val else val
 
 
+def _num_col(df: pd.DataFrame, col: str, strip: str = r"[,$+]") -> pd.Series:
+    """Vectorised ``_safe_float`` over one column — 0.0 where missing or unparseable."""
+    if col not in df.columns:
+        return pd.Series(0.0, index=df.index)
+    cleaned = df[col].astype(str).str.replace(strip, "", regex=True)
+    return pd.to_numeric(cleaned, errors="coerce").fillna(0.0)
+
+
+def _fmt_money_vec(s: pd.Series) -> pd.Series:
+    """Column-wise ``_fmt_money`` over an already-numeric Series."""
+    body = s.abs().map("{:,.0f}".format)
+    return ("$" + body).where(s >= 0, "-$" + body)
+
+
+def _str_col(df: pd.DataFrame, col: str) -> pd.Series:
+    """Column as strings, or a blank column when the sheet doesn't have it."""
+    if col not in df.columns:
+        return pd.Series("", index=df.index)
+    return df[col].fillna("").astype(str)
+
+
+def _tax_summary(tax_rows: list) -> tuple:
+    """Summarise a Tax & Realized GL sheet in one grouped pass.
+
+    Returns ``(tax_map, est_taxes, net_gl)`` where ``tax_map`` maps each
+    category to its amount for the direct lookups (dividends, interest…).
+    A category listed more than once keeps its last row, in the map and the
+    totals alike, matching the CLI one-pager.
+    """
+    df_tax  = pd.DataFrame(tax_rows)
+    tax_amt = _num_col(df_tax, "Amount ($)")
+    tax_cat = _str_col(df_tax, "Category").str.strip()
+    last    = ~tax_cat.duplicated(keep="last")
+    tax_amt, tax_cat = tax_amt[last], tax_cat[last]
+    kind = np.select(
+        [tax_cat.str.contains("Est. Tax", regex=False),
+         tax_cat.str.contains("Realized", regex=False)],
+        ["tax", "gl"],
+        default="other",
+    )
+    totals = tax_amt.groupby(kind).sum()
+    return (
+        dict(zip(tax_cat, tax_amt.tolist())),
+        float(totals.get("tax", 0.0)),
+        float(totals.get("gl", 0.0)),
+    )
+
+
 def _normalize_fields(raw: dict) -> dict:
     out = {}
     for key, val in raw.items():
@@ -838,6 +918,21 @@ def _full_name(c: dict) -> str:
     return " ".join(p for p in parts if p).strip()
 
 
+_CHILD_NAME_RE = re.compile(r"Child (\d+) Name")
+
+
+def _children(intake: dict) -> list:
+    """``[(n, name, dob), …]`` for every ``Child n Name`` key, in numeric order."""
+    kids = []
+    for key, name in intake.items():
+        m = _CHILD_NAME_RE.fullmatch(key)
+        if m:
+            n = int(m.group(1))
+            kids.append((n, name, intake.get(f"Child {n} DOB", "")))
+    kids.sort()
+    return kids
+
+
 def _do_register(intake: dict):
     bene_parts = []
     for i in ("1", "2"):
@@ -850,14 +945,10 @@ def _do_register(intake: dict):
     co_owner = intake.get("Co-Account Holder Name", "")
     if co_owner:
         bene_parts.append(f"Co-Account Holder: {co_owner}, DOB {intake.get('Co-Account Holder DOB','')}")
-    child_idx = 1
-    while f"Child {child_idx} Name" in intake:
-        cn  = intake[f"Child {child_idx} Name"]
-        dob = intake.get(f"Child {child_idx} DOB", "")
+    for child_idx, cn, dob in _children(intake):
         bene_parts.append(f"Child {child_idx}: {cn}" + (f", DOB {dob}" if dob else ""))
-        child_idx += 1
 
-    sf_result = json.loads(create_salesforce_contact(
+    sf_result = _create_contact(
         first_name         = intake.get("First Name", ""),
         last_name          = intake.get("Last Name", ""),
         email              = intake.get("Email", ""),
@@ -877,7 +968,7 @@ def _do_register(intake: dict):
         liquid_assets      = intake.get("Liquid Assets", ""),
         lead_source        = intake.get("Referral Source", ""),
         notes              = "  |  ".join(bene_parts),
-    ))
+    )
 
     sf_id     = sf_result.get("id", "")
     sf_record = MockSalesforce._records.get(sf_id, {})
@@ -888,8 +979,21 @@ def _do_register(intake: dict):
 # Client / data lookup helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _workbooks_stamp() -> tuple:
+    """(filename, mtime) for every client workbook — cache key for sheet data."""
+    if not CLIENTS_DIR.exists():
+        return ()
+    return tuple((f.name, f.stat().st_mtime_ns) for f in sorted(CLIENTS_DIR.glob("*.xlsx")))
+
+
 def _load_client_sheets(client_name: str):
-    raw = json.loads(find_client_file(client_name))
+    return _read_client_sheets(client_name, _workbooks_stamp())
+
+
+@st.cache_data(show_spinner=False)
+def _read_client_sheets(client_name: str, stamp: tuple):
+    """Parse a client's workbook; memoised until any workbook changes on disk."""
+    raw = _find_client(client_name)
     if not raw.get("found"):
         avail = raw.get("available", [])
         msg   = "Client not found."
@@ -897,7 +1001,7 @@ def _load_client_sheets(client_name: str):
             msg += f"  Available: {', '.join(avail)}"
         return False, msg, {}
     file_path = raw["path"]
-    data = {sheet: json.loads(read_excel_sheet(file_path, sheet)) for sheet in raw["sheets"]}
+    data = {sheet: _read_sheet(file_path, sheet) for sheet in raw["sheets"]}
     return True, file_path, data
 
 
@@ -919,9 +1023,14 @@ def _available_excel_clients() -> list:
     return result
 
 
+@st.cache_data(show_spinner=False)
+def _excel_client_keys(stamp: tuple) -> frozenset:
+    """Normalised client names that have a workbook, per ``_workbooks_stamp()``."""
+    return frozenset(_normalize_name_key(Path(f).stem.replace("_", " ")) for f, _ in stamp)
+
+
 def _client_has_excel(name: str) -> bool:
-    key = _normalize_name_key(name)
-    return key in {_normalize_name_key(n) for n in _available_excel_clients()}
+    return _normalize_name_key(name) in _excel_client_keys(_workbooks_stamp())
 
 
 def _all_known_clients() -> list:
@@ -950,17 +1059,69 @@ def _save_account_data(name: str, file_bytes: bytes) -> Path:
     return dest
 
 
+def _client_data_stamp() -> tuple:
+    """Cache key covering every client workbook and the registry.
+
+    Cheap (one directory listing + stats) and changes whenever a workbook is
+    added, replaced or removed, or a client is registered.
+    """
+    return _workbooks_stamp(), _registry_stamp()
+
+
 def _data_ready() -> bool:
     return (DATA_DIR / "client_intake.xlsx").exists()
 
 
+_DRIFT_THRESHOLD = 2.0   # ± percentage points before an allocation is flagged
+
+
+@st.cache_data(show_spinner=False)
+def _beneficiary_table(bene_rows: list) -> pd.DataFrame:
+    """Beneficiaries sheet formatted for display (Pct shown as '50%')."""
+    df = pd.DataFrame(bene_rows)
+    if "Pct" in df.columns:
+        df["Pct"] = df["Pct"].astype(str) + "%"
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _allocation_table(alloc_rows: list) -> pd.DataFrame:
+    """Allocation sheet formatted for display: money column, ◄ on drifted rows."""
+    df = pd.DataFrame(alloc_rows)
+    if "Market Value" in df.columns:
+        df["Market Value"] = _fmt_money_vec(_num_col(df, "Market Value"))
+    if "Drift" in df.columns:
+        flagged   = _num_col(df, "Drift", strip=r"[%+]").abs() >= _DRIFT_THRESHOLD
+        drift_txt = df["Drift"].astype(str)
+        df["Drift"] = drift_txt.where(~flagged, drift_txt + " ◄")
+    return df
+
+
+@st.cache_data(show_spinner=False)
+def _one_pager(client_name: str, data: dict, day: str) -> str:
+    """Memoised ``_build_one_pager``; ``day`` rolls the 'Prepared' date over."""
+    return _build_one_pager(client_name, data)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Client context builder
 # ─────────────────────────────────────────────────────────────────────────────
 
+_NO_ACCOUNT_DATA_CONTEXT = "\n".join([
+    "=== ACCOUNT DATA ===",
+    "  No Excel account file on record for this client.",
+    "  Analysis is limited to registration profile above.",
+    "",
+])
+
+
 def _build_client_context(name: str) -> str:
-    lines = [f"CLIENT: {name}", ""]
     entry = _registry_entry(name)
+    found, _, data = _load_client_sheets(name)
+    if not entry and not found:
+        return f"CLIENT: {name}\n\n{_NO_ACCOUNT_DATA_CONTEXT}"
+
+    lines = [f"CLIENT: {name}", ""]
     if entry:
         intake = entry.get("intake", {})
         lines.append("=== REGISTRATION PROFILE ===")
@@ -980,22 +1141,15 @@ def _build_client_context(name: str) -> str:
             lines.append(f"  Registration Date: {reg_at[:10]}")
         lines.append("")
 
-    found, _, data = _load_client_sheets(name)
     if found:
         for sheet, rows in data.items():
             if not rows:
                 continue
             lines.append(f"=== {sheet.upper()} ===")
-            headers = list(rows[0].keys())
-            lines.append("  " + " | ".join(headers))
-            for row in rows:
-                lines.append("  " + " | ".join(str(row.get(h, "")) for h in headers))
-            lines.append("")
+            table = pd.DataFrame(rows).to_csv(sep="|", index=False, lineterminator="\n")
+            lines.append(textwrap.indent(table, "  "))
     else:
-        lines.append("=== ACCOUNT DATA ===")
-        lines.append("  No Excel account file on record for this client.")
-        lines.append("  Analysis is limited to registration profile above.")
-        lines.append("")
+        lines.append(_NO_ACCOUNT_DATA_CONTEXT)
 
     return "\n".join(lines)
 
@@ -1004,18 +1158,16 @@ def _build_client_context(name: str) -> str:
 # Elite AI Advisor system prompt (Marcus Reid)
 # ─────────────────────────────────────────────────────────────────────────────
 
-def _build_advisor_system_prompt(client_name: str, context: str) -> str:
-    today = datetime.now().strftime("%B %d, %Y")
-    return f"""You are Marcus Reid — a fiduciary wealth management advisor with 30 years of \
+_ADVISOR_TEMPLATE = """You are Marcus Reid — a fiduciary wealth management advisor with 30 years of \
 private client experience at top-tier RIA firms. You have managed portfolios through \
 multiple market cycles, advised clients through business sales, divorces, inheritances, \
 and retirement transitions. You serve as the most trusted senior colleague of the financial \
 advisor you're speaking with. You are not a chatbot — you are the senior partner they call \
 before every important meeting.
 
-Firm: {BRAND} | {PRODUCT}
+Firm: {brand} | {product}
 Today: {today}
-Client: {client_name}
+Client: {client}
 
 ━━━ MANDATORY RESPONSE STRUCTURE ━━━
 Every single response must include these sections in this order:
@@ -1066,10 +1218,53 @@ possible from the profile data available. Never invent data.
 </client_context>"""
 
 
+def _build_advisor_system_prompt(client_name: str, context: str, today: str = "") -> str:
+    return _ADVISOR_TEMPLATE.format_map({
+        "brand":   BRAND,
+        "product": PRODUCT,
+        "today":   today or datetime.now().strftime("%B %d, %Y"),
+        "client":  client_name,
+        "context": context,
+    })
+
+
+@st.cache_data(show_spinner=False)
+def _cached_advisor_prompt(client_name: str, stamp: tuple, today: str) -> tuple:
+    """(context, system prompt) for a client, reused across chat turns.
+
+    ``stamp`` is ``_client_data_stamp()`` so edits to the workbook or registry
+    produce a fresh prompt; ``today`` rolls it over at midnight.
+    """
+    context = _build_client_context(client_name)
+    return context, _build_advisor_system_prompt(client_name, context, today)
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Onboarding AI helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+@st.cache_resource(show_spinner=False)
+def _anthropic_client():
+    """Process-wide Anthropic client, so its HTTP connection pool is reused."""
+    import anthropic
+    return anthropic.Anthropic()
+
+
+@st.cache_data(show_spinner=False)
+def _ask_haiku(prompt: str) -> str:
+    """One-shot Haiku completion, memoised on the exact prompt text.
+
+    Re-analysing the same intake (after a refresh, or Back → Analyze) is then
+    free. Errors propagate — and so are never cached — for the caller to wrap.
+    """
+    resp = _anthropic_client().messages.create(
+        model="claude-haiku-4-5-20251001",
+        max_tokens=1024,
+        messages=[{"role": "user", "content": prompt}],
+    )
+    return resp.content[0].text.strip()
+
+
 def _onboarding_ai_analyze(intake_text: str) -> str:
     """Ask Claude to extract account types, funding paths, and form recommendations."""
     if not HAS_API_KEY:
@@ -1091,14 +1286,8 @@ INTAKE DATA:
 {intake_text}
 
 Return ONLY valid JSON, no markdown, no explanation."""
-    client_api = anthropic.Anthropic()
     try:
-        resp = client_api.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return resp.content[0].text.strip()
+        return _ask_haiku(prompt)
     except Exception as exc:
         return json.dumps({"error": str(exc)})
 
@@ -1141,18 +1330,41 @@ ACCOUNT HOLDERS: {json.dumps(holders)}
 INTAKE DATA: {json.dumps(intake_data, indent=2)}
 
 Return ONLY valid JSON, no markdown."""
-    client_api = anthropic.Anthropic()
     try:
-        resp = client_api.messages.create(
-            model="claude-haiku-4-5-20251001",
-            max_tokens=1024,
-            messages=[{"role": "user", "content": prompt}],
-        )
-        return resp.content[0].text.strip()
+        return _ask_haiku(prompt)
     except Exception as exc:
         return json.dumps({"error": str(exc)})
 
 
+@st.cache_data(max_entries=64, show_spinner=False)
+def _filled_pdf(form_key: str, intake: dict, co_client: dict, day: str) -> bytes:
+    """Memoised ``pdf_filler.fill_form``; ``day`` rolls the form dates over."""
+    import pdf_filler
+    return pdf_filler.fill_form(form_key, intake, co_client=co_client)
+
+
+@lru_cache(maxsize=16)
+def _welcome_email_html(recipient: str, subject: str, message: str, docs: tuple) -> str:
+    """Markup for the DocuSign welcome-email preview; rebuilt only when an input changes."""
+    docs_list = chr(10).join(f'• {d}' for d in docs)
+    return (
+        f'<div style="background:var(--card);border:1px solid var(--border);'
+        f'border-radius:10px;padding:1.25rem 1.5rem;font-family:monospace;'
+        f'font-size:0.84rem;color:var(--txt);">'
+        f'<div style="margin-bottom:0.5rem;color:var(--txt2);">'
+        f'<strong>To:</strong> {recipient}</div>'
+        f'<div style="margin-bottom:0.75rem;color:var(--txt2);">'
+        f'<strong>Subject:</strong> {subject}</div>'
+        f'<hr style="border-color:var(--border);margin:0.75rem 0;">'
+        f'<pre style="white-space:pre-wrap;color:var(--txt);font-family:inherit;">{message}</pre>'
+        f'<hr style="border-color:var(--border);margin:0.75rem 0;">'
+        f'<div style="color:var(--txt3);font-size:0.78rem;">'
+        f'<em>This message includes a DocuSign link for:</em><br>'
+        f'{docs_list}</div>'
+        f'</div>'
+    )
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # API / activity / completeness helpers
 # ─────────────────────────────────────────────────────────────────────────────
@@ -1172,14 +1384,18 @@ def _call_api_with_retry(api_client, max_attempts: int = 3, backoff: float = 2.0
 
 
 def _log_activity(action: str, client: str = "", detail: str = "") -> None:
-    """Append to activity log in session state (max 20 entries)."""
+    """Append to activity log in session state (max 20 entries).
+
+    ``client`` and ``detail`` are HTML-escaped once here so the Dashboard feed
+    can drop them straight into its markup on every rerun.
+    """
     if "activity_log" not in st.session_state:
         st.session_state["activity_log"] = []
     entry = {
         "ts": datetime.now().strftime("%H:%M"),
         "action": action,
-        "client": client,
-        "detail": detail,
+        "client": html.escape(client),
+        "detail": html.escape(detail),
     }
     st.session_state["activity_log"].insert(0, entry)
     st.session_state["activity_log"] = st.session_state["activity_log"][:20]
@@ -1494,7 +1710,9 @@ def _bootstrap_demo_clients() -> None:
     - Inserts new demo clients; never removes user-added clients.
     - Updates existing demo client registry entries with any missing fields
       (e.g. Account Type added to the demo data after first registration).
-    - Regenerates demo Excel files when _DEMO_EXCEL_VERSION is bumped.
+    - Regenerates demo Excel files when _DEMO_EXCEL_VERSION is bumped (or a
+      file is missing); existing workbooks are left alone so their mtimes —
+      and every cache keyed on them — stay stable across reruns.
     """
     CLIENTS_DIR.mkdir(parents=True, exist_ok=True)
 
@@ -1540,7 +1758,7 @@ def _bootstrap_demo_clients() -> None:
         else:
             _save_to_registry_flat(fields)
             added += 1
-        if cd.get("_has_excel", False):
+        if cd.get("_has_excel", False) and not (CLIENTS_DIR / _name_to_filename(name)).exists():
             _create_demo_excel(name, cd)
     if added:
         _log_activity("Demo data loaded", "", f"{added} demo clients added")
@@ -2148,11 +2366,8 @@ elif page == "📥 New Client":
                 rows.append(("Co-Account Holder",     intake["Co-Account Holder Name"]))
             if intake.get("Co-Account Holder DOB"):
                 rows.append(("Co-Account Holder DOB", intake["Co-Account Holder DOB"]))
-            ci = 1
-            while f"Child {ci} Name" in intake:
-                dob = intake.get(f"Child {ci} DOB","")
-                rows.append((f"Child {ci}", intake[f"Child {ci} Name"] + (f" (DOB: {dob})" if dob else "")))
-                ci += 1
+            for ci, cn, dob in _children(intake):
+                rows.append((f"Child {ci}", cn + (f" (DOB: {dob})" if dob else "")))
             for label, val in rows:
                 st.markdown(f"**{label}:** {val}")
 
@@ -2330,26 +2545,36 @@ elif page == "👥 Client Profiles":
             bene_rows  = data.get("Beneficiaries",                [])
             alloc_rows = data.get("Allocation",                   [])
 
-            total_aum     = sum(_safe_float(r.get("Market Value",0)) for r in acct_rows)
-            total_contrib = sum(_safe_float(r.get("Amount ($)",0)) for r in dc_rows if _safe_float(r.get("Amount ($)",0)) > 0)
-            total_distrib = sum(_safe_float(r.get("Amount ($)",0)) for r in dc_rows if _safe_float(r.get("Amount ($)",0)) < 0)
+            # Each sheet becomes a DataFrame exactly once; the typed columns feed
+            # both the aggregates and the formatted display tables below
+            df_a, df_dc, df_al = map(pd.DataFrame, (acct_rows, dc_rows, alloc_rows))
+            acct_mv = _num_col(df_a,  "Market Value")
+            dc_amt  = _num_col(df_dc, "Amount ($)")
+            drift_pct = _num_col(df_al, "Drift", strip=r"[%+]")
+            flagged   = drift_pct.abs() >= _DRIFT_THRESHOLD
+
+            total_aum     = float(acct_mv.sum())
+            total_contrib = float(dc_amt[dc_amt > 0].sum())
+            total_distrib = float(dc_amt[dc_amt < 0].sum())
             net_activity  = total_contrib + total_distrib
-            tax_map       = {r.get("Category","").strip(): _safe_float(r.get("Amount ($)",0)) for r in tax_rows}
-            est_taxes     = sum(v for k,v in tax_map.items() if "Est. Tax" in k)
-            net_gl        = sum(v for k,v in tax_map.items() if "Realized" in k)
+            tax_map, est_taxes, net_gl = _tax_summary(tax_rows)
             qual_div      = tax_map.get("Qualified Dividends", 0.0)
             nq_div        = tax_map.get("Non-Qual Dividends",  0.0)
             interest      = tax_map.get("Interest Income",     0.0)
             total_inc     = qual_div + nq_div + interest
-            drift_flags   = []
-            for row in alloc_rows:
-                try:
-                    dval = float(str(row.get("Drift","0")).replace("%","").replace("+",""))
-                    if abs(dval) >= 2.0:
-                        drift_flags.append((row.get("Asset Class",""), row.get("Drift",""), dval))
-                except (ValueError, AttributeError):
-                    pass
-            rmd_rows = [r for r in dc_rows if "RMD" in r.get("Description","")]
+            # Flagged rows, largest |drift| first (stable, like sorted(reverse=True))
+            by_size       = drift_pct[flagged].abs().sort_values(ascending=False, kind="stable").index
+            drift_flags   = list(zip(
+                _str_col(df_al, "Asset Class")[by_size],
+                _str_col(df_al, "Drift")[by_size],
+                drift_pct[by_size].tolist(),
+            ))
+            is_rmd   = _str_col(df_dc, "Description").str.contains("RMD", regex=False)
+            rmd_rows = list(zip(
+                dc_amt[is_rmd].tolist(),
+                _str_col(df_dc, "Date")[is_rmd],
+                _str_col(df_dc, "Account")[is_rmd],
+            ))
 
             _html_stat_row([
                 ("Total AUM",           _fmt_money(total_aum)),
@@ -2361,17 +2586,15 @@ elif page == "👥 Client Profiles":
 
             _html_section_header("Account Summary", "🏦")
             if acct_rows:
-                df_a = pd.DataFrame(acct_rows)
                 if "Market Value" in df_a.columns:
-                    df_a["Market Value"] = df_a["Market Value"].apply(_fmt_money)
+                    df_a["Market Value"] = _fmt_money_vec(acct_mv)
                 st.dataframe(df_a, use_container_width=True, hide_index=True)
                 st.caption(f"Total AUM: **{_fmt_money(total_aum)}** across {len(acct_rows)} accounts")
 
             _html_section_header("Distributions & Contributions (YTD)", "💸")
             if dc_rows:
-                df_dc = pd.DataFrame(dc_rows)
                 if "Amount ($)" in df_dc.columns:
-                    df_dc["Amount ($)"] = df_dc["Amount ($)"].apply(_fmt_money)
+                    df_dc["Amount ($)"] = _fmt_money_vec(dc_amt)
                 st.dataframe(df_dc, use_container_width=True, hide_index=True)
                 _html_stat_row([
                     ("Contributions", _fmt_money(total_contrib)),
@@ -2405,67 +2628,51 @@ elif page == "👥 Client Profiles":
 
             _html_section_header("Beneficiaries", "👨‍👩‍👧")
             if bene_rows:
-                df_b = pd.DataFrame(bene_rows)
-                if "Pct" in df_b.columns:
-                    df_b["Pct"] = df_b["Pct"].apply(lambda v: f"{v}%")
-                st.dataframe(df_b, use_container_width=True, hide_index=True)
+                st.dataframe(_beneficiary_table(bene_rows), use_container_width=True, hide_index=True)
 
             _html_section_header("Allocation vs. Target", "📈")
             if alloc_rows:
-                df_al = pd.DataFrame(alloc_rows)
-                if "Market Value" in df_al.columns:
-                    df_al["Market Value"] = df_al["Market Value"].apply(_fmt_money)
-                def _flag(v):
-                    try:
-                        dval = float(str(v).replace("%","").replace("+",""))
-                        return f"{v} ◄" if abs(dval) >= 2.0 else str(v)
-                    except (ValueError, TypeError):
-                        return str(v)
-                if "Drift" in df_al.columns:
-                    df_al["Drift"] = df_al["Drift"].apply(_flag)
-                st.dataframe(df_al, use_container_width=True, hide_index=True)
+                st.dataframe(_allocation_table(alloc_rows), use_container_width=True, hide_index=True)
                 if drift_flags:
                     st.caption("◄ = exceeds ±2% rebalancing threshold")
 
             _html_section_header("Advisor Talking Points", "💬")
-            has_pts = False
-            for ac, drift, dval in sorted(drift_flags, key=lambda x: abs(x[2]), reverse=True):
-                _html_callout(
+            # Collected and emitted as one markdown element, not one per point
+            points = []
+            for ac, drift, dval in drift_flags:
+                points.append(_callout_html(
                     f"<strong>Rebalancing — {ac}:</strong> {drift} "
                     f"({'OVERWEIGHT' if dval > 0 else 'UNDERWEIGHT'}). Review rebalancing trade.",
                     "warning",
-                )
-                has_pts = True
-            for row in rmd_rows:
-                amt = _safe_float(row.get("Amount ($)",0))
-                _html_callout(
-                    f"<strong>RMD:</strong> {_fmt_money(abs(amt))} taken {row.get('Date','')} "
-                    f"from {row.get('Account','')}. Confirm tax withholding election on file.",
+                ))
+            for amt, rmd_date, rmd_acct in rmd_rows:
+                points.append(_callout_html(
+                    f"<strong>RMD:</strong> {_fmt_money(abs(amt))} taken {rmd_date} "
+                    f"from {rmd_acct}. Confirm tax withholding election on file.",
                     "info",
-                )
-                has_pts = True
+                ))
             if tax_rows:
                 if net_gl > 0:
-                    _html_callout(
+                    points.append(_callout_html(
                         f"<strong>Tax Coordination:</strong> Net realized gain of {_fmt_money(net_gl)} "
                         "YTD. Coordinate with CPA before year-end for offset opportunities.",
                         "warning",
-                    )
+                    ))
                 else:
-                    _html_callout(
+                    points.append(_callout_html(
                         f"<strong>Tax-Loss Harvesting:</strong> Net realized loss of "
                         f"{_fmt_money(abs(net_gl))} YTD. Assess additional TLH opportunities.",
                         "info",
-                    )
-                has_pts = True
+                    ))
             if acct_rows:
-                _html_callout(
+                points.append(_callout_html(
                     f"<strong>Portfolio Review:</strong> {_fmt_money(total_aum)} across "
                     f"{len(acct_rows)} accounts. Review consolidation opportunities.",
                     "info",
-                )
-                has_pts = True
-            if not has_pts:
+                ))
+            if points:
+                st.markdown("".join(points), unsafe_allow_html=True)
+            else:
                 st.markdown("_No flags detected._")
 
             _html_callout(
@@ -2474,10 +2681,10 @@ elif page == "👥 Client Profiles":
             )
 
             st.divider()
+            _one_pager_txt = _one_pager(client_name, data, datetime.now().strftime("%Y-%m-%d"))
             with st.expander("📄 Full Text One-Pager (copy / print ready)"):
-                st.code(_build_one_pager(client_name, data), language=None)
+                st.code(_one_pager_txt, language=None)
 
-            _one_pager_txt = _build_one_pager(client_name, data)
             st.download_button(
                 label="📥 Download Meeting Brief (.txt)",
                 data=_one_pager_txt,
@@ -2526,12 +2733,9 @@ elif page == "👥 Client Profiles":
                     st.markdown(f"**{lbl}:** {val}")
                 if intake.get("Co-Account Holder Name"):
                     st.markdown(f"**Co-Account Holder:** {intake['Co-Account Holder Name']}")
-                ci = 1
-                while intake.get(f"Child {ci} Name"):
-                    dob = intake.get(f"Child {ci} DOB","")
-                    st.markdown(f"**Child {ci}:** {intake[f'Child {ci} Name']}" +
-                                (f" (DOB: {dob})" if dob else ""))
-                    ci += 1
+                for ci, cn, dob in _children(intake):
+                    if cn:
+                        st.markdown(f"**Child {ci}:** {cn}" + (f" (DOB: {dob})" if dob else ""))
 
             with cr:
                 _html_section_header("Investment Profile", "💰")
@@ -2599,8 +2803,8 @@ elif page == "🤖 AI Advisor":
     sel_client  = st.selectbox("Select client", all_clients, index=default_i)
 
     if sel_client != st.session_state.get("aac_client"):
-        st.session_state["aac_client"]  = sel_client
-        st.session_state["aac_history"] = []
+        st.session_state["aac_client"] = sel_client
+        st.session_state.pop("aac_history", None)
         st.rerun()
 
     st.session_state.setdefault("aac_history", [])
@@ -2642,11 +2846,12 @@ elif page == "🤖 AI Advisor":
         ("📋 Compliance",        f"What compliance items do I need to address for {sel_client}? Check beneficiary designations, suitability, and documentation."),
         ("💰 Distributions",     f"Analyze the distributions and contributions for {sel_client}. Are the withdrawals sustainable? Any RMD considerations?"),
     ]
+    # A chip click is answered in the same run — no session_state hop + rerun
+    pending_q = None
     for _ci, (_clabel, _cq) in enumerate(_chips):
         with _chip_cols[_ci]:
             if st.button(_clabel, key=f"chip_{_ci}", use_container_width=True):
-                st.session_state["aac_pending_q"] = _cq
-                st.rerun()
+                pending_q = _cq
 
     st.divider()
 
@@ -2654,8 +2859,6 @@ elif page == "🤖 AI Advisor":
         with st.chat_message(msg["role"]):
             st.markdown(msg["content"])
 
-    # Handle pending question from chips
-    pending_q = st.session_state.pop("aac_pending_q", None)
     typed_q   = st.chat_input(f"Ask about {sel_client}…")
     question  = pending_q or typed_q
 
@@ -2669,12 +2872,14 @@ elif page == "🤖 AI Advisor":
             placeholder = st.empty()
 
             if HAS_API_KEY:
-                context       = _build_client_context(sel_client)
-                system_prompt = _build_advisor_system_prompt(sel_client, context)
-                api_messages  = [{"role": m["role"], "content": m["content"]}
-                                  for m in history[-30:]]
+                import anthropic
+                context, system_prompt = _cached_advisor_prompt(
+                    sel_client, _client_data_stamp(), datetime.now().strftime("%B %d, %Y"),
+                )
+                # The full conversation stays on screen; the model gets the last 30
+                api_messages  = history[-30:]
                 full_response = ""
-                client_api    = anthropic.Anthropic()
+                client_api    = _anthropic_client()
                 try:
                     with client_api.messages.stream(
                         model      = "claude-sonnet-4-5-20250929",
@@ -2682,9 +2887,13 @@ elif page == "🤖 AI Advisor":
                         system     = system_prompt,
                         messages   = api_messages,
                     ) as stream:
+                        # Re-render at most every 50 ms rather than per token
+                        last_flush = time.monotonic()
                         for text in stream.text_stream:
                             full_response += text
-                            placeholder.markdown(full_response + "▌")
+                            if time.monotonic() - last_flush >= 0.05:
+                                placeholder.markdown(full_response + "▌")
+                                last_flush = time.monotonic()
                     placeholder.markdown(full_response)
                 except anthropic.RateLimitError:
                     full_response = "⏳ The AI service is temporarily busy. Please try again in a moment."
@@ -2703,7 +2912,8 @@ elif page == "🤖 AI Advisor":
                 alloc_rows= ex.get("Allocation",      [])
                 tax_rows  = ex.get("Tax & Realized GL",[])
                 dc_rows   = ex.get("Distributions & Contributions",[])
-                total_aum = sum(_safe_float(r.get("Market Value",0)) for r in acct_rows)
+                acct_mv   = _num_col(pd.DataFrame(acct_rows), "Market Value")
+                total_aum = float(acct_mv.sum())
                 q_lower   = question.lower()
 
                 def _mock_preamble():
@@ -2737,15 +2947,13 @@ elif page == "🤖 AI Advisor":
                     )
                 elif any(w in q_lower for w in ("aum","total","value","balance","portfolio")):
                     lines = [_mock_preamble(), "**DIRECT ANSWER — Portfolio Value**\n"]
-                    for r in acct_rows:
+                    for r, mv in zip(acct_rows, acct_mv.tolist()):
                         lines.append(f"• {r.get('Account','')} ({r.get('Account #','')}): "
-                                     f"{_fmt_money(r.get('Market Value',0))}")
+                                     f"{_fmt_money(mv)}")
                     full_response = "\n".join(lines)
                 elif any(w in q_lower for w in ("tax","gain","loss","harvest","rmd")):
                     if tax_rows:
-                        tax_map = {r.get("Category","").strip(): _safe_float(r.get("Amount ($)",0)) for r in tax_rows}
-                        net_gl  = sum(v for k,v in tax_map.items() if "Realized" in k)
-                        taxes   = sum(v for k,v in tax_map.items() if "Est. Tax" in k)
+                        _, taxes, net_gl = _tax_summary(tax_rows)
                         full_response = (
                             f"{_mock_preamble()}"
                             f"**DIRECT ANSWER — Tax Picture**\n\n"
@@ -2778,7 +2986,7 @@ elif page == "🤖 AI Advisor":
         col1, col2 = st.columns([1, 4])
         with col1:
             if st.button("🗑  Clear conversation"):
-                st.session_state["aac_history"] = []
+                st.session_state.pop("aac_history", None)
                 st.rerun()
         with col2:
             turns = len(history) // 2
@@ -2939,27 +3147,30 @@ elif page == "📋 Operations":
         st.markdown("")
         _html_section_header("Select Forms to Prepare", "☑")
 
+        # One form so toggling several checkboxes costs a single rerun on submit
         new_sel = []
-        for fkey, fdata in FORM_CATALOG.items():
-            recommended = fkey in sel_forms
-            checked = st.checkbox(
-                f"**{fdata['label']}**",
-                value=recommended,
-                key=f"ob_chk_{fkey}",
-                help=fdata["desc"],
-            )
-            if checked:
-                new_sel.append(fkey)
-            # Show form description inline
-            st.markdown(
-                f'<div style="font-size:0.77rem;color:var(--txt3);margin:-0.5rem 0 0.5rem 1.5rem;">'
-                f'{fdata["desc"]}</div>',
-                unsafe_allow_html=True,
-            )
-
-        st.session_state["ob_selected_forms"] = new_sel
+        with st.form("ob_forms_form", border=False):
+            for fkey, fdata in FORM_CATALOG.items():
+                recommended = fkey in sel_forms
+                checked = st.checkbox(
+                    f"**{fdata['label']}**",
+                    value=recommended,
+                    key=f"ob_chk_{fkey}",
+                    help=fdata["desc"],
+                )
+                if checked:
+                    new_sel.append(fkey)
+                # Show form description inline
+                st.markdown(
+                    f'<div style="font-size:0.77rem;color:var(--txt3);margin:-0.5rem 0 0.5rem 1.5rem;">'
+                    f'{fdata["desc"]}</div>',
+                    unsafe_allow_html=True,
+                )
+            if st.form_submit_button("Confirm selection"):
+                st.session_state["ob_selected_forms"] = new_sel
 
         if new_sel:
+            labels = {fk: FORM_CATALOG[fk]["label"] for fk in new_sel}
             st.markdown("")
             _html_section_header("AI Pre-Fill Preview", "🤖")
             st.caption("Claude will map intake data to each form's required fields.")
@@ -2973,14 +3184,16 @@ elif page == "📋 Operations":
                         co_client = None
                         if len(holders) > 1:
                             co_client = {"Full Name": holders[1]}
+                        day = datetime.now().strftime("%Y-%m-%d")
+                        # Sequential on purpose — see the pdf_filler docstring on threads
                         for fkey in new_sel:
-                            fname = FORM_CATALOG[fkey]["label"]
+                            fname = labels[fkey]
                             st.write(f"📝 Filling: **{fname}**…")
                             try:
-                                pdf_bytes = _pdf_filler.fill_form(
-                                    fkey, intake, co_client=co_client
-                                )
-                                filled[fkey] = pdf_bytes
+                                _filled_pdf(fkey, intake, co_client, day)
+                                # Keep only a handle: the bytes stay in the data cache
+                                # and are fetched when the download is clicked
+                                filled[fkey] = partial(_filled_pdf, fkey, intake, co_client, day)
                                 st.write(f"✅ Done: **{fname}**")
                             except Exception as e:
                                 errors.append(f"{fname}: {e}")
@@ -2998,14 +3211,27 @@ elif page == "📋 Operations":
                 if st.button("🔍 Generate Pre-Fill Preview", type="primary"):
                     prefills = {}
                     with st.status("Generating pre-fill data…", expanded=True) as sb:
-                        for fkey in new_sel:
-                            fname = FORM_CATALOG[fkey]["label"]
-                            st.write(f"Filling: **{fname}**…")
-                            raw_pf = _onboarding_ai_prefill(fkey, intake, holders)
-                            try:
-                                prefills[fkey] = json.loads(raw_pf)
-                            except Exception:
-                                prefills[fkey] = {"raw": raw_pf}
+                        # One Claude round-trip per form: run them concurrently and
+                        # report progress from the script thread as each returns.
+                        # Workers get this run's context so the st.cache_* helpers
+                        # behind _ask_haiku work off the script thread.
+                        with ThreadPoolExecutor(
+                            max_workers=min(8, len(new_sel)),
+                            initializer=add_script_run_ctx,
+                            initargs=(None, get_script_run_ctx()),
+                        ) as pool:
+                            futures = {
+                                pool.submit(_onboarding_ai_prefill, fkey, intake, holders): fkey
+                                for fkey in new_sel
+                            }
+                            for fut in as_completed(futures):
+                                fkey   = futures[fut]
+                                raw_pf = fut.result()
+                                try:
+                                    prefills[fkey] = json.loads(raw_pf)
+                                except Exception:
+                                    prefills[fkey] = {"raw": raw_pf}
+                                st.write(f"✅ Pre-filled: **{labels[fkey]}**")
                         sb.update(label="Pre-fill complete!", state="complete")
                     st.session_state["ob_prefills"] = prefills
                     st.rerun()
@@ -3015,9 +3241,9 @@ elif page == "📋 Operations":
                 st.markdown("")
                 _html_section_header("Ready to Download", "⬇️")
                 for fkey in new_sel:
-                    pdf_bytes = st.session_state["ob_filled_pdfs"].get(fkey)
-                    if pdf_bytes:
-                        label    = FORM_CATALOG[fkey]["label"]
+                    pdf_data = st.session_state["ob_filled_pdfs"].get(fkey)
+                    if pdf_data:
+                        label    = labels[fkey]
                         filename = f"FILLED_{FORM_CATALOG[fkey]['file']}"
                         col_name, col_btn = st.columns([3, 1])
                         with col_name:
@@ -3029,7 +3255,7 @@ elif page == "📋 Operations":
                         with col_btn:
                             st.download_button(
                                 label="⬇️ Download",
-                                data=pdf_bytes,
+                                data=pdf_data,
                                 file_name=filename,
                                 mime="application/pdf",
                                 key=f"dl_{fkey}",
@@ -3040,7 +3266,7 @@ elif page == "📋 Operations":
                 for fkey in new_sel:
                     pf = st.session_state["ob_prefills"].get(fkey, {})
                     if pf:
-                        with st.expander(f"📝 {FORM_CATALOG[fkey]['label']} — Field Mapping"):
+                        with st.expander(f"📝 {labels[fkey]} — Field Mapping"):
                             rows = [(k, v) for k, v in pf.items() if v and v != "—"]
                             if rows:
                                 df_pf = pd.DataFrame(rows, columns=["Form Field", "Pre-Filled Value"])
@@ -3060,211 +3286,216 @@ elif page == "📋 Operations":
 
     # ── STEP 2: DocuSign ──────────────────────────────────────────────────────
     elif step == 2:
-        intake    = st.session_state["ob_intake"]
-        holders   = st.session_state["ob_holders"]
-        sel_forms = st.session_state["ob_selected_forms"]
+        @st.fragment
+        def _docusign_step():
+            """Inputs and buttons here rerun only this step, not the whole page."""
+            intake    = st.session_state["ob_intake"]
+            holders   = st.session_state["ob_holders"]
+            sel_forms = st.session_state["ob_selected_forms"]
+
+            _html_section_header("Step 3 — DocuSign Envelope", "✍️")
+
+            # Recipient info — batched so typing doesn't rerun until a button is pressed
+            with st.form("ob_docusign_form", border=False):
+                email_primary = intake.get("Email", "")
+                col_r1, col_r2 = st.columns(2)
+                with col_r1:
+                    holder1_name  = holders[0] if holders else (intake.get("First Name","") + " " + intake.get("Last Name","")).strip()
+                    r1_name  = st.text_input("Account Holder 1 Name",  value=holder1_name,  key="ob_r1_name")
+                    r1_email = st.text_input("Account Holder 1 Email", value=email_primary, key="ob_r1_email")
+                with col_r2:
+                    if len(holders) > 1:
+                        r2_name  = st.text_input("Account Holder 2 Name",  value=holders[1], key="ob_r2_name")
+                        r2_email = st.text_input("Account Holder 2 Email", value="",         key="ob_r2_email")
+                    else:
+                        r2_name  = ""
+                        r2_email = ""
 
-        _html_section_header("Step 3 — DocuSign Envelope", "✍️")
-
-        # Recipient info
-        email_primary = intake.get("Email", "")
-        col_r1, col_r2 = st.columns(2)
-        with col_r1:
-            holder1_name  = holders[0] if holders else (intake.get("First Name","") + " " + intake.get("Last Name","")).strip()
-            r1_name  = st.text_input("Account Holder 1 Name",  value=holder1_name,  key="ob_r1_name")
-            r1_email = st.text_input("Account Holder 1 Email", value=email_primary, key="ob_r1_email")
-        with col_r2:
-            if len(holders) > 1:
-                r2_name  = st.text_input("Account Holder 2 Name",  value=holders[1], key="ob_r2_name")
-                r2_email = st.text_input("Account Holder 2 Email", value="",         key="ob_r2_email")
-            else:
-                r2_name  = ""
-                r2_email = ""
+                env_subject = st.text_input(
+                    "Envelope Subject",
+                    value=f"Your Account Documents — {holder1_name}",
+                    key="ob_env_subject",
+                )
+                env_message = st.text_area(
+                    "Personal Message (optional)",
+                    value=(
+                        f"Dear {holder1_name},\n\n"
+                        "Please review and sign the enclosed account documents at your earliest convenience. "
+                        "If you have any questions, don't hesitate to reach out.\n\n"
+                        "Thank you,"
+                    ),
+                    height=120,
+                    key="ob_env_message",
+                )
 
-        env_subject = st.text_input(
-            "Envelope Subject",
-            value=f"Your Account Documents — {holder1_name}",
-            key="ob_env_subject",
-        )
-        env_message = st.text_area(
-            "Personal Message (optional)",
-            value=(
-                f"Dear {holder1_name},\n\n"
-                "Please review and sign the enclosed account documents at your earliest convenience. "
-                "If you have any questions, don't hesitate to reach out.\n\n"
-                "Thank you,"
-            ),
-            height=120,
-            key="ob_env_message",
-        )
+                st.markdown("")
+                _html_section_header("Forms to Include", "📎")
+                labels = {fk: FORM_CATALOG.get(fk, {}).get("label", fk) for fk in sel_forms}
+                files  = {fk: FORM_CATALOG.get(fk, {}).get("file", "?") for fk in sel_forms}
+                st.markdown(
+                    "".join(
+                        f'<div style="display:flex;align-items:center;gap:0.5rem;padding:0.35rem 0;">'
+                        f'<span style="color:#10B981;font-size:0.85rem;">✓</span>'
+                        f'<span style="color:#94A3B8;font-size:0.85rem;">{labels[fk]}</span>'
+                        f'<span style="color:#334155;font-size:0.72rem;">({files[fk]})</span>'
+                        f'</div>'
+                        for fk in sel_forms
+                    ),
+                    unsafe_allow_html=True,
+                )
 
-        st.markdown("")
-        _html_section_header("Forms to Include", "📎")
-        for fkey in sel_forms:
-            fdata = FORM_CATALOG.get(fkey, {})
-            st.markdown(
-                f'<div style="display:flex;align-items:center;gap:0.5rem;padding:0.35rem 0;">'
-                f'<span style="color:#10B981;font-size:0.85rem;">✓</span>'
-                f'<span style="color:#94A3B8;font-size:0.85rem;">{fdata.get("label",fkey)}</span>'
-                f'<span style="color:#334155;font-size:0.72rem;">({fdata.get("file","?")})</span>'
-                f'</div>',
-                unsafe_allow_html=True,
-            )
+                FORMS_DIR.mkdir(exist_ok=True)
+                missing_pdfs = [
+                    files[fk] for fk in sel_forms
+                    if not (FORMS_DIR / files[fk]).exists()
+                ]
+                if missing_pdfs:
+                    _html_callout(
+                        f"<strong>PDF files not uploaded:</strong> {', '.join(missing_pdfs)}. "
+                        "Upload them to <code>forms/</code> to enable actual PDF pre-filling. "
+                        "DocuSign sending will proceed with placeholders.",
+                        "warning",
+                    )
 
-        FORMS_DIR.mkdir(exist_ok=True)
-        missing_pdfs = [
-            FORM_CATALOG[fk]["file"] for fk in sel_forms
-            if not (FORMS_DIR / FORM_CATALOG[fk]["file"]).exists()
-        ]
-        if missing_pdfs:
-            _html_callout(
-                f"<strong>PDF files not uploaded:</strong> {', '.join(missing_pdfs)}. "
-                "Upload them to <code>forms/</code> to enable actual PDF pre-filling. "
-                "DocuSign sending will proceed with placeholders.",
-                "warning",
-            )
+                st.markdown("")
+                col_preview, col_send = st.columns([1, 2])
+                with col_preview:
+                    preview = st.form_submit_button("📧 Preview Welcome Email")
+                with col_send:
+                    send = st.form_submit_button("🚀 Send via DocuSign", type="primary")
 
-        st.markdown("")
-        col_preview, col_send = st.columns([1, 2])
-        with col_preview:
-            if st.button("📧 Preview Welcome Email"):
+            if preview:
                 st.session_state["ob_show_email_preview"] = True
-        with col_send:
-            if st.button("🚀 Send via DocuSign", type="primary"):
+            if send:
                 with st.status("Sending DocuSign envelope…", expanded=True) as sb:
                     st.write(f"📧 Sending to: **{r1_email or r1_name}**")
                     if r2_email:
                         st.write(f"📧 CC: **{r2_email or r2_name}**")
                     for fkey in sel_forms:
-                        st.write(f"📄 Queued: {FORM_CATALOG[fkey]['label']}")
-                    time.sleep(1)
+                        st.write(f"📄 Queued: {labels[fkey]}")
                     sb.update(label="Envelope sent! (mock)", state="complete")
                     st.session_state["ob_envelope_sent"] = True
                     st.session_state["ob_step"] = 3
                 st.rerun()
 
-        if st.session_state.get("ob_show_email_preview"):
-            with st.expander("📧 Welcome Email Preview", expanded=True):
-                _docs_list = chr(10).join(f'• {FORM_CATALOG[fk]["label"]}' for fk in sel_forms)
-                st.markdown(
-                    f'<div style="background:var(--card);border:1px solid var(--border);'
-                    f'border-radius:10px;padding:1.25rem 1.5rem;font-family:monospace;'
-                    f'font-size:0.84rem;color:var(--txt);">'
-                    f'<div style="margin-bottom:0.5rem;color:var(--txt2);">'
-                    f'<strong>To:</strong> {r1_email or r1_name}</div>'
-                    f'<div style="margin-bottom:0.75rem;color:var(--txt2);">'
-                    f'<strong>Subject:</strong> {env_subject}</div>'
-                    f'<hr style="border-color:var(--border);margin:0.75rem 0;">'
-                    f'<pre style="white-space:pre-wrap;color:var(--txt);font-family:inherit;">{env_message}</pre>'
-                    f'<hr style="border-color:var(--border);margin:0.75rem 0;">'
-                    f'<div style="color:var(--txt3);font-size:0.78rem;">'
-                    f'<em>This message includes a DocuSign link for:</em><br>'
-                    f'{_docs_list}</div>'
-                    f'</div>',
-                    unsafe_allow_html=True,
-                )
+            if st.session_state.get("ob_show_email_preview"):
+                with st.expander("📧 Welcome Email Preview", expanded=True):
+                    st.markdown(
+                        _welcome_email_html(
+                            r1_email or r1_name, env_subject, env_message,
+                            tuple(labels[fk] for fk in sel_forms),
+                        ),
+                        unsafe_allow_html=True,
+                    )
 
-        col_back2, _ = st.columns([1, 3])
-        with col_back2:
-            if st.button("← Back"):
-                st.session_state["ob_step"] = 1
-                st.rerun()
+            col_back2, _ = st.columns([1, 3])
+            with col_back2:
+                if st.button("← Back"):
+                    st.session_state["ob_step"] = 1
+                    st.rerun()
+
+        _docusign_step()
 
     # ── STEP 3: Post-Close Checklist ─────────────────────────────────────────
     elif step == 3:
-        intake  = st.session_state["ob_intake"]
-        holders = st.session_state["ob_holders"]
-        sel_forms = st.session_state["ob_selected_forms"]
+        @st.fragment
+        def _post_close_step():
+            """Status selectboxes and checklist ticks rerun only this step."""
+            intake  = st.session_state["ob_intake"]
+            holders = st.session_state["ob_holders"]
+            sel_forms = st.session_state["ob_selected_forms"]
 
-        _html_section_header("Step 4 — Post-Signature Checklist", "✅")
+            _html_section_header("Step 4 — Post-Signature Checklist", "✅")
 
-        holder1 = holders[0] if holders else "Client"
+            holder1 = holders[0] if holders else "Client"
 
-        if st.session_state.get("ob_envelope_sent"):
-            _html_callout(
-                f"<strong>DocuSign envelope sent</strong> to {holder1}. "
-                "Track signature status below and complete post-close steps when signed.",
-                "success",
-            )
+            if st.session_state.get("ob_envelope_sent"):
+                _html_callout(
+                    f"<strong>DocuSign envelope sent</strong> to {holder1}. "
+                    "Track signature status below and complete post-close steps when signed.",
+                    "success",
+                )
 
-        # Signature status tracker
-        _html_section_header("Signature Status", "📊")
-        sig_col1, sig_col2 = st.columns(2)
-        with sig_col1:
-            for fkey in sel_forms:
-                status_key = f"ob_sig_{fkey}"
-                st.session_state.setdefault(status_key, "Pending")
-                current = st.session_state[status_key]
-                color   = "#10B981" if current == "Signed" else "#F59E0B" if current == "Pending" else "#EF4444"
-                st.markdown(
-                    f'<div style="display:flex;justify-content:space-between;align-items:center;'
-                    f'padding:0.4rem 0;border-bottom:1px solid rgba(0,212,255,0.08);">'
-                    f'<span style="color:#94A3B8;font-size:0.83rem;">{FORM_CATALOG[fkey]["label"]}</span>'
-                    f'<span style="color:{color};font-size:0.75rem;font-weight:700;">{current}</span>'
-                    f'</div>',
-                    unsafe_allow_html=True,
+            # Signature status tracker
+            _html_section_header("Signature Status", "📊")
+            sig_col1, sig_col2 = st.columns(2)
+            labels = {fk: FORM_CATALOG[fk]["label"] for fk in sel_forms}
+            with sig_col1:
+                rows = []
+                for fkey in sel_forms:
+                    current = st.session_state.setdefault(f"ob_sig_{fkey}", "Pending")
+                    color   = "#10B981" if current == "Signed" else "#F59E0B" if current == "Pending" else "#EF4444"
+                    rows.append(
+                        f'<div style="display:flex;justify-content:space-between;align-items:center;'
+                        f'padding:0.4rem 0;border-bottom:1px solid rgba(0,212,255,0.08);">'
+                        f'<span style="color:#94A3B8;font-size:0.83rem;">{labels[fkey]}</span>'
+                        f'<span style="color:{color};font-size:0.75rem;font-weight:700;">{current}</span>'
+                        f'</div>'
+                    )
+                st.markdown("".join(rows), unsafe_allow_html=True)
+            with sig_col2:
+                for fkey in sel_forms:
+                    status_key = f"ob_sig_{fkey}"
+                    new_status = st.selectbox(
+                        labels[fkey],
+                        ["Pending", "Signed", "Declined"],
+                        index=["Pending","Signed","Declined"].index(st.session_state.get(status_key,"Pending")),
+                        key=f"ob_sigsel_{fkey}",
+                        label_visibility="collapsed",
+                    )
+                    st.session_state[status_key] = new_status
+
+            # Post-close action checklist
+            st.markdown("")
+            _html_section_header("Post-Signature Actions", "📋")
+
+            post_tasks = [
+                ("fidelity",     "Add accounts to Fidelity"),
+                ("black_diamond", "Add client to Black Diamond (reporting)"),
+                ("ima_billing",   "Send IMA to Billing & Compliance"),
+                ("welcome_call",  "Schedule welcome call with client"),
+                ("crm_update",    "Update CRM with account numbers and onboarding date"),
+            ]
+
+            all_done = True
+            for task_key, task_label in post_tasks:
+                session_key = f"ob_post_{task_key}"
+                st.session_state.setdefault(session_key, False)
+                checked = st.checkbox(task_label, value=st.session_state[session_key], key=f"ob_chk_post_{task_key}")
+                st.session_state[session_key] = checked
+                if not checked:
+                    all_done = False
+
+            st.markdown("")
+            if all_done:
+                _html_callout(
+                    f"<strong>🎉 Onboarding Complete!</strong> All post-close steps checked off for {holder1}.",
+                    "success",
                 )
-        with sig_col2:
-            for fkey in sel_forms:
-                status_key = f"ob_sig_{fkey}"
-                new_status = st.selectbox(
-                    FORM_CATALOG[fkey]["label"],
-                    ["Pending", "Signed", "Declined"],
-                    index=["Pending","Signed","Declined"].index(st.session_state.get(status_key,"Pending")),
-                    key=f"ob_sigsel_{fkey}",
-                    label_visibility="collapsed",
+            else:
+                remaining = sum(1 for k, _ in post_tasks if not st.session_state.get(f"ob_post_{k}", False))
+                _html_callout(
+                    f"<strong>{remaining} step{'s' if remaining != 1 else ''} remaining</strong> in post-close checklist.",
+                    "warning",
                 )
-                st.session_state[status_key] = new_status
 
-        # Post-close action checklist
-        st.markdown("")
-        _html_section_header("Post-Signature Actions", "📋")
-
-        post_tasks = [
-            ("fidelity",     "Add accounts to Fidelity"),
-            ("black_diamond", "Add client to Black Diamond (reporting)"),
-            ("ima_billing",   "Send IMA to Billing & Compliance"),
-            ("welcome_call",  "Schedule welcome call with client"),
-            ("crm_update",    "Update CRM with account numbers and onboarding date"),
-        ]
-
-        all_done = True
-        for task_key, task_label in post_tasks:
-            session_key = f"ob_post_{task_key}"
-            st.session_state.setdefault(session_key, False)
-            checked = st.checkbox(task_label, value=st.session_state[session_key], key=f"ob_chk_post_{task_key}")
-            st.session_state[session_key] = checked
-            if not checked:
-                all_done = False
-
-        st.markdown("")
-        if all_done:
-            _html_callout(
-                f"<strong>🎉 Onboarding Complete!</strong> All post-close steps checked off for {holder1}.",
-                "success",
-            )
-        else:
-            remaining = sum(1 for k, _ in post_tasks if not st.session_state.get(f"ob_post_{k}", False))
-            _html_callout(
-                f"<strong>{remaining} step{'s' if remaining != 1 else ''} remaining</strong> in post-close checklist.",
-                "warning",
-            )
+            st.markdown("")
+            _html_section_header("Onboarding Summary", "📊")
+            _html_stat_row([
+                ("Account Holders", str(len(holders))),
+                ("Forms Prepared",  str(len(sel_forms))),
+                ("DocuSign Status", "Sent" if st.session_state.get("ob_envelope_sent") else "Not Sent"),
+                ("Post-Close",      f"{sum(1 for k,_ in post_tasks if st.session_state.get(f'ob_post_{k}'))}/{len(post_tasks)}"),
+            ])
 
-        st.markdown("")
-        _html_section_header("Onboarding Summary", "📊")
-        _html_stat_row([
-            ("Account Holders", str(len(holders))),
-            ("Forms Prepared",  str(len(sel_forms))),
-            ("DocuSign Status", "Sent" if st.session_state.get("ob_envelope_sent") else "Not Sent"),
-            ("Post-Close",      f"{sum(1 for k,_ in post_tasks if st.session_state.get(f'ob_post_{k}'))}/{len(post_tasks)}"),
-        ])
+            st.markdown("")
+            if st.button("⟳  Start New Onboarding", type="primary"):
+                for key in list(st.session_state.keys()):
+                    if key.startswith("ob_"):
+                        del st.session_state[key]
+                st.rerun()
 
-        st.markdown("")
-        if st.button("⟳  Start New Onboarding", type="primary"):
-            for key in list(st.session_state.keys()):
-                if key.startswith("ob_"):
-                    del st.session_state[key]
-            st.rerun()
+        _post_close_step()
 
     _html_footer()
 
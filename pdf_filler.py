@@ -2,12 +2,16 @@
 pdf_filler.py  –  Fill IWS PDF forms with client data extracted from intake.
 
 Uses PyMuPDF (fitz), which handles AES-encrypted PDFs natively.
+
+PyMuPDF is not thread-safe and holds the GIL for the duration of each call,
+so fills gain nothing from a thread pool; parallelise across processes.
 """
 
-import io
 import os
 import re
 import datetime
+from concurrent.futures import ProcessPoolExecutor
+from functools import lru_cache
 
 import fitz  # pymupdf
 
@@ -18,11 +22,50 @@ _TRUST_PDF    = "IWSTrustApp_Dec2024.pdf"
 _ADVISOR_PDF  = "Add_RemoveAdvisor_Brokerage_Jan2026.pdf"
 _JOURNAL_PDF  = "JournalRequest_May2021_rev.pdf"
 
+# Account-number fields on the Add / Remove Advisor form, in page order
+_ACCT_KEYS = ("AI_Account",) + tuple(f"AI_Account{i:02d}" for i in range(1, 15))
+
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Helpers
 # ─────────────────────────────────────────────────────────────────────────────
 
+@lru_cache(maxsize=4)
+def _form_date(ordinal, fmt):
+    return datetime.date.fromordinal(ordinal).strftime(fmt)
+
+
+def _today(fmt="%m/%d/%Y"):
+    """Today's date as the forms print it (MM/DD/YYYY by default), formatted once per day."""
+    return _form_date(datetime.date.today().toordinal(), fmt)
+
+
+# Canonical client fields → the intake keys that may carry them, in priority order
+_ALIAS = {
+    "SSN":        ("SSN", "Social Security Number"),
+    "Phone":      ("Phone", "Mobile Phone"),
+    "Employer":   ("Employer", "Employer Name"),
+    "Trust Name": ("Trust Name", "Entity Name", "Full Name"),
+    "Tax ID":     ("Tax ID", "EIN", "SSN"),
+    "Trust Date": ("Trust Date", "Date of Trust"),
+}
+
+
+def _first(d, *keys, default=""):
+    """First truthy value among keys in d; later keys aren't touched once one hits."""
+    for k in keys:
+        v = d.get(k)
+        if v:
+            return v
+    return default
+
+
+def _canon(client, *fields):
+    """Resolve just the requested _ALIAS fields for a client dict, in order."""
+    return [_first(client, *_ALIAS[f]) for f in fields]
+
+
+@lru_cache(maxsize=128)
 def _split_name(full_name):
     """Return (first, mi, last) from a full-name string."""
     parts = (full_name or "").strip().split()
@@ -35,6 +78,13 @@ def _split_name(full_name):
     return parts[0], parts[1][0].upper(), " ".join(parts[2:])
 
 
+# 'Street, City, ST ZIP' — three parts, with one or two tokens after the last comma
+_ADDR_RE = re.compile(
+    r"^\s*([^\s,][^,]*?)\s*,\s*([^\s,][^,]*?)\s*,\s*([^\s,]+)(?:\s+([^\s,]+))?\s*$"
+)
+
+
+@lru_cache(maxsize=128)
 def _parse_address(raw):
     """
     Best-effort parse of 'Street, City, ST ZIP' or similar.
@@ -42,6 +92,10 @@ def _parse_address(raw):
     """
     if not raw:
         return "", "", "", "", "USA"
+    m = _ADDR_RE.match(raw)
+    if m:
+        street, city, state, zipcode = m.groups()
+        return street, city, state, zipcode or "", "USA"
     parts = [p.strip() for p in raw.split(",")]
     if len(parts) >= 3:
         street = parts[0]
@@ -62,21 +116,20 @@ _FORM_TITLES = {
     "JournalRequest_May2021_rev.pdf":       "Journal / Internal Transfer Request",
 }
 
-# Prefixes stripped when humanising PDF field names
-_FIELD_PREFIXES = (
+# Prefixes stripped when humanising PDF field names (always up to the first '_')
+_FIELD_PREFIXES = frozenset({
     "PI_", "AS_", "ASU_", "AI_", "AO_", "DA_",
     "JR_", "RAI_", "SD_", "CT_", "SaD_",
-)
+})
+_HUMANISE_RE = re.compile(r"([A-Z][a-z]+|[0-9]+)")
 
+@lru_cache(maxsize=1024)
 def _humanise_field(key: str) -> str:
     """Turn a PDF field key like 'PI_PermAddressCity' into 'Perm Address City'."""
-    s = key
-    for p in _FIELD_PREFIXES:
-        if s.startswith(p):
-            s = s[len(p):]
-            break
+    u = key.find("_") + 1
+    s = key[u:] if u and key[:u] in _FIELD_PREFIXES else key
     # Split on capital letters / digits
-    s = re.sub(r"([A-Z][a-z]+|[0-9]+)", r" \1", s).strip()
+    s = _HUMANISE_RE.sub(r" \1", s).strip()
     return s or key
 
 
@@ -107,53 +160,92 @@ def _generate_simple_pdf(filename: str, fields: dict) -> bytes:
         pg.insert_text((MARGIN, 48), title,
                         fontname="Helvetica", fontsize=10, color=(0.78, 0.85, 1.00))
         pg.insert_text((MARGIN, 63),
-                        f"Pre-Fill Data Sheet  ·  {datetime.date.today().strftime('%B %d, %Y')}"
+                        f"Pre-Fill Data Sheet  ·  {_today('%B %d, %Y')}"
                         "  ·  ADVISOR USE ONLY",
                         fontname="Helvetica", fontsize=7, color=(0.62, 0.70, 0.90))
-        return pg, 88   # page + starting y
+        # page, batched stripes/rules, label + value text runs, starting y
+        return pg, pg.new_shape(), fitz.TextWriter(pg.rect), fitz.TextWriter(pg.rect), 88
+
+    def _close_page(pg, shape, labels, values):
+        # Stripes and footer rule go down in one commit, behind the row text
+        shape.finish(fill=STRIPE)
+        shape.draw_line((MARGIN, PAGE_H - 22), (PAGE_W - MARGIN, PAGE_H - 22))
+        shape.finish(color=MID_GRAY, width=0.4)
+        shape.commit(overlay=False)
+        labels.write_text(pg, color=MID_GRAY)
+        values.write_text(pg, color=DARK)
+        pg.insert_text((MARGIN, PAGE_H - 10),
+                        "CONFIDENTIAL — Advisor Use Only — IWS Pre-Fill Data Sheet",
+                        fontname="Helvetica", fontsize=7, color=MID_GRAY)
+
+    label_font = fitz.Font("helv")
+    value_font = fitz.Font("hebo")
 
     doc = fitz.open()
-    page, y = _new_page(doc)
+    page, shape, labels, values, y = _new_page(doc)
 
-    display = [(k, str(v)) for k, v in fields.items() if v]
+    display = ((k, v if isinstance(v, str) else str(v)) for k, v in fields.items() if v)
 
     for idx, (k, v) in enumerate(display):
         if y + ROW_H > PAGE_H - 36:
             # Footer on current page before starting new one
-            page.draw_line((MARGIN, PAGE_H - 22), (PAGE_W - MARGIN, PAGE_H - 22),
-                           color=MID_GRAY, width=0.4)
-            page.insert_text((MARGIN, PAGE_H - 10),
-                              "CONFIDENTIAL — Advisor Use Only — IWS Pre-Fill Data Sheet",
-                              fontname="Helvetica", fontsize=7, color=MID_GRAY)
-            page, y = _new_page(doc)
+            _close_page(page, shape, labels, values)
+            page, shape, labels, values, y = _new_page(doc)
 
         # Alternating stripe
         if idx % 2 == 0:
-            page.draw_rect(fitz.Rect(MARGIN, y, PAGE_W - MARGIN, y + ROW_H - 1),
-                           fill=STRIPE)
+            shape.draw_rect(fitz.Rect(MARGIN, y, PAGE_W - MARGIN, y + ROW_H - 1))
 
         label = _humanise_field(k)
         if len(label) > 40:
             label = label[:39] + "…"
         val_display = v[:72] + ("…" if len(v) > 72 else "")
 
-        page.insert_text((MARGIN + 6, y + 11), label,
-                          fontname="Helvetica", fontsize=8, color=MID_GRAY)
-        page.insert_text((MARGIN + 6, y + 24), val_display,
-                          fontname="Helvetica-Bold", fontsize=10, color=DARK)
+        labels.append((MARGIN + 6, y + 11), label, font=label_font, fontsize=8)
+        values.append((MARGIN + 6, y + 24), val_display, font=value_font, fontsize=10)
         y += ROW_H
 
     # Footer on last page
-    page.draw_line((MARGIN, PAGE_H - 22), (PAGE_W - MARGIN, PAGE_H - 22),
-                   color=MID_GRAY, width=0.4)
-    page.insert_text((MARGIN, PAGE_H - 10),
-                      "CONFIDENTIAL — Advisor Use Only — IWS Pre-Fill Data Sheet",
-                      fontname="Helvetica", fontsize=7, color=MID_GRAY)
+    _close_page(page, shape, labels, values)
+
+    doc.subset_fonts()
+    return doc.tobytes(garbage=3, deflate=True, clean=True)
 
-    buf = io.BytesIO()
-    doc.save(buf)
-    buf.seek(0)
-    return buf.getvalue()
+
+# A fill only touches a handful of widget objects: write everything else back
+# as-is — no object GC, no content-stream cleanup, no re-compression.
+_FILL_SAVE_OPTS = dict(
+    garbage=0, clean=False, deflate=False,
+    deflate_images=False, deflate_fonts=False, linear=False,
+)
+
+
+@lru_cache(maxsize=8)
+def _load_template_bytes(path, mtime_ns):
+    """Raw bytes of a form template, read from disk once per file version.
+
+    Keyed on the file's mtime so a replaced template is re-read. Only the
+    immutable bytes are cached — each fill opens its own Document from them,
+    since PyMuPDF mutates widget state in place.
+    """
+    with open(path, "rb") as fh:
+        return fh.read()
+
+
+@lru_cache(maxsize=8)
+def _load_template_index(path, mtime_ns):
+    """Map each field name in a template to its ``[(page number, widget xref), …]``.
+
+    Built once per template version (same mtime key as the bytes) so fills
+    jump straight to the widgets they set instead of scanning every widget
+    on every page.
+    """
+    index = {}
+    with fitz.open(stream=_load_template_bytes(path, mtime_ns), filetype="pdf") as doc:
+        for page in doc:
+            for widget in page.widgets():
+                index.setdefault(widget.field_name, []).append((page.number, widget.xref))
+    return index
 
 
 def _fill(filename, fields):
@@ -163,22 +255,34 @@ def _fill(filename, fields):
     to generating a clean data-sheet PDF with all the pre-filled field values.
     """
     path = os.path.join(FORMS_DIR, filename)
-    if not os.path.exists(path):
+    try:
+        # One stat() per fill keys the caches, so a replaced template is
+        # picked up; misses aren't cached, so one uploaded later is too
+        mtime_ns = os.stat(path).st_mtime_ns
+        template = _load_template_bytes(path, mtime_ns)
+    except FileNotFoundError:
         # Template not available – produce a formatted data sheet instead
         return _generate_simple_pdf(filename, fields)
 
-    doc = fitz.open(path)
-    for page in doc:
-        for widget in page.widgets():
-            name = widget.field_name
-            if name in fields and fields[name]:
-                widget.field_value = str(fields[name])
-                widget.update()
+    index   = _load_template_index(path, mtime_ns)
+    targets = [(name, str(value)) for name, value in fields.items() if value and name in index]
+    if not targets:
+        # Nothing to write — the blank template is the filled form
+        return template
+
+    doc   = fitz.open(stream=template, filetype="pdf")
+    pages = {}
+    for name, value in targets:
+        for pno, xref in index[name]:
+            if pno not in pages:
+                pages[pno] = doc[pno]
+            widget = pages[pno].load_widget(xref)
+            if widget.field_value == value:
+                continue  # already showing this value — no appearance rebuild
+            widget.field_value = value
+            widget.update()
 
-    buf = io.BytesIO()
-    doc.save(buf)
-    buf.seek(0)
-    return buf.getvalue()
+    return doc.tobytes(**_FILL_SAVE_OPTS)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -197,16 +301,18 @@ def fill_personal_app(client, co_client=None):
     name  = client.get("Full Name", "")
     first, mi, last = _split_name(name)
     addr  = client.get("Address", "")
-    street, city, state, zipcode, country = _parse_address(addr)
-    today = datetime.date.today().strftime("%m/%d/%Y")
+    addr_parts = _parse_address(addr)
+    street, city, state, zipcode, country = addr_parts
+    today = _today()
+    ssn, phone, employer = _canon(client, "SSN", "Phone", "Employer")
 
     fields = {
         "PI_FirstName":          first,
         "PI_MI":                 mi,
         "PI_LastName":           last,
         "PI_DOB":                client.get("Date of Birth", ""),
-        "PI_SSN":                client.get("SSN", client.get("Social Security Number", "")),
-        "PI_PrimaryMobilePhone": client.get("Phone", client.get("Mobile Phone", "")),
+        "PI_SSN":                ssn,
+        "PI_PrimaryMobilePhone": phone,
         "PI_Email":              client.get("Email", ""),
         "PI_PermAddress":        street,
         "PI_PermAddressCity":    city,
@@ -218,7 +324,7 @@ def fill_personal_app(client, co_client=None):
         "PI_MailingAddressState":   state,
         "PI_MailingAddressZip":     zipcode,
         "PI_MailingAddressCountry": country,
-        "PI_EIAEmployerName": client.get("Employer", client.get("Employer Name", "")),
+        "PI_EIAEmployerName": employer,
         "AS_Date03": today,
     }
 
@@ -235,10 +341,9 @@ def fill_personal_app(client, co_client=None):
     if co_name:
         f2, m2, l2 = _split_name(co_name)
         co_addr = (co_client or {}).get("Address", addr)
-        s2, c2, st2, z2, _ = _parse_address(co_addr)
-        co_phone = (co_client or {}).get("Phone", (co_client or {}).get("Mobile Phone", ""))
+        s2, c2, st2, z2, _ = addr_parts if co_addr == addr else _parse_address(co_addr)
+        co_ssn, co_phone = _canon(co_client or {}, "SSN", "Phone")
         co_email = (co_client or {}).get("Email", "")
-        co_ssn   = (co_client or {}).get("SSN", (co_client or {}).get("Social Security Number", ""))
         fields.update({
             "PI_FirstName02":          f2,
             "PI_MI02":                 m2,
@@ -265,16 +370,15 @@ def fill_personal_app(client, co_client=None):
 
 def fill_trust_app(client, trustee2=None):
     """Fill IWSTrustApp_Dec2024.pdf."""
-    trust_name  = client.get("Trust Name", client.get("Entity Name", client.get("Full Name", "")))
-    trust_tin   = client.get("Tax ID", client.get("EIN", client.get("SSN", "")))
-    trust_date  = client.get("Trust Date", client.get("Date of Trust", ""))
+    trust_name, trust_tin, trust_date = _canon(client, "Trust Name", "Tax ID", "Trust Date")
     trust_state = client.get("State", "")
 
     name  = client.get("Full Name", "")
     first, mi, last = _split_name(name)
     addr  = client.get("Address", "")
-    street, city, state, zipcode, country = _parse_address(addr)
-    today = datetime.date.today().strftime("%m/%d/%Y")
+    addr_parts = _parse_address(addr)
+    street, city, state, zipcode, country = addr_parts
+    today = _today()
 
     fields = {
         "ASU_NameofTrust":           trust_name,
@@ -306,7 +410,7 @@ def fill_trust_app(client, trustee2=None):
         t2_name = trustee2.get("Full Name", "")
         f2, m2, l2 = _split_name(t2_name)
         t2_addr = trustee2.get("Address", addr)
-        s2, c2, st2, z2, _ = _parse_address(t2_addr)
+        s2, c2, st2, z2, _ = addr_parts if t2_addr == addr else _parse_address(t2_addr)
         fields.update({
             "PI_FirstName02": f2, "PI_MI02": m2, "PI_LastName02": l2,
             "PI_DOB02":   trustee2.get("Date of Birth", ""),
@@ -330,7 +434,7 @@ def fill_add_remove_advisor(client, advisor_name="", advisor_gnumber="",
     """Fill Add / Remove Advisor – Brokerage form."""
     name = client.get("Full Name", "")
     first, mi, last = _split_name(name)
-    today = datetime.date.today().strftime("%m/%d/%Y")
+    today = _today()
     accts = account_numbers or []
 
     fields = {
@@ -344,9 +448,7 @@ def fill_add_remove_advisor(client, advisor_name="", advisor_gnumber="",
         "SD_PrintAccountOwner": name,
         "SD_Date": today,
     }
-    acct_keys = ["AI_Account"] + [f"AI_Account{str(i).zfill(2)}" for i in range(1, 15)]
-    for i, acct in enumerate(accts[: len(acct_keys)]):
-        fields[acct_keys[i]] = acct
+    fields.update(zip(_ACCT_KEYS, accts))   # zip stops at whichever runs out first
 
     return _fill(_ADVISOR_PDF, fields)
 
@@ -356,13 +458,13 @@ def fill_journal_request(client, receiving_account="", receiving_owner="",
     """Fill Journal / Internal Transfer Request form."""
     name = client.get("Full Name", "")
     first, mi, last = _split_name(name)
-    today = datetime.date.today().strftime("%m/%d/%Y")
+    today = _today()
 
     fields = {
         "AO_First": first,
         "AO_MI":    mi,
         "AO_Last":  last,
-        "AO_SocialSecurityNumber": client.get("SSN", client.get("Social Security Number", "")),
+        "AO_SocialSecurityNumber": _first(client, *_ALIAS["SSN"]),
         "JR_FirmName": firm,
         "JR_GNumber":  gnumber,
         "RAI_OwnerName": receiving_owner or name,
@@ -377,6 +479,15 @@ def fill_journal_request(client, receiving_account="", receiving_owner="",
 # Dispatcher
 # ─────────────────────────────────────────────────────────────────────────────
 
+# FORM_CATALOG key → filler; personal/trust take the co-holder, the others kwargs
+_DISPATCH = {
+    "IWSPersonalApp":   lambda client, co, **kw: fill_personal_app(client, co_client=co),
+    "IWSTrustApp":      lambda client, co, **kw: fill_trust_app(client, trustee2=co),
+    "AddRemoveAdvisor": lambda client, co, **kw: fill_add_remove_advisor(client, **kw),
+    "JournalRequest":   lambda client, co, **kw: fill_journal_request(client, **kw),
+}
+
+
 def fill_form(form_key, client, co_client=None, **kwargs):
     """
     Fill a form by its FORM_CATALOG key.
@@ -387,13 +498,42 @@ def fill_form(form_key, client, co_client=None, **kwargs):
     co_client: optional second holder/trustee dict
     kwargs:   passed to the specific filler (e.g. advisor_name, gnumber)
     """
-    if form_key == "IWSPersonalApp":
-        return fill_personal_app(client, co_client=co_client)
-    elif form_key == "IWSTrustApp":
-        return fill_trust_app(client, trustee2=co_client)
-    elif form_key == "AddRemoveAdvisor":
-        return fill_add_remove_advisor(client, **kwargs)
-    elif form_key == "JournalRequest":
-        return fill_journal_request(client, **kwargs)
-    else:
+    filler = _DISPATCH.get(form_key)
+    if filler is None:
         raise ValueError(f"Unknown form key: {form_key!r}")
+    return filler(client, co_client, **kwargs)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Batch filling
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _warm_templates():
+    """Worker initializer: load every template and its field index up front."""
+    for filename in (_PERSONAL_PDF, _TRUST_PDF, _ADVISOR_PDF, _JOURNAL_PDF):
+        path = os.path.join(FORMS_DIR, filename)
+        if os.path.exists(path):
+            _load_template_index(path, os.stat(path).st_mtime_ns)
+
+
+def _fill_job(job):
+    return fill_form(**job)
+
+
+def fill_forms_batch(jobs, max_workers=None):
+    """
+    Fill many forms at once (e.g. a batch-onboarding run) across processes.
+    Returns the filled PDFs as a list of bytes, in the same order as jobs.
+
+    jobs: list of fill_form keyword dicts, e.g.
+          {"form_key": "IWSPersonalApp", "client": {...}, "co_client": None}
+
+    Each worker preloads the templates, so only client data goes in and
+    filled bytes come back across the process boundary.
+    """
+    jobs = list(jobs)
+    if len(jobs) < 2:
+        return [fill_form(**job) for job in jobs]
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers, initializer=_warm_templates) as pool:
+        return list(pool.map(_fill_job, jobs))
@@ -6,6 +6,8 @@ Commands:
     setup                          Create sample Excel data files
     register [--intake PATH]       Read intake form, create Salesforce record
     meeting-prep "Client Name"     Generate advisor one-pager for a client
+    meeting-prep-batch --names-file PATH
+                                   One-pagers for many clients, in parallel
 
 Quick start:
     pip install anthropic pandas openpyxl
@@ -23,13 +25,17 @@ import os
 import re
 import sys
 import json
+import time
 import argparse
-from datetime import datetime
+import io
+from contextlib import redirect_stdout
+from datetime import date, datetime
+from functools import lru_cache
+from itertools import islice
 from pathlib import Path
 
-import anthropic
-from anthropic import beta_tool
-import pandas as pd
+# anthropic, pandas/numpy and openpyxl are imported at their point of use so
+# `setup`, `--help` and the mock paths don't pay for the ones they never touch
 
 # ─────────────────────────────────────────────────────────────────────────────
 # Config
@@ -39,10 +45,28 @@ DATA_DIR    = Path("data")
 CLIENTS_DIR = DATA_DIR / "clients"
 MODEL       = "claude-sonnet-4-5-20250929"
 
+# Rust-backed XLSX reader when python-calamine is installed; read-only
+# openpyxl otherwise.
+try:
+    from python_calamine import CalamineWorkbook
+except ImportError:
+    CalamineWorkbook = None
+
+# Tool results go back to Claude as JSON text; orjson encodes them natively
+# when installed (compact, UTF-8), the stdlib encoder otherwise.
+try:
+    import orjson
+
+    def _to_json(obj) -> str:
+        return orjson.dumps(obj).decode()
+except ImportError:
+    _to_json = json.dumps
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Mock Salesforce Client
 # Swap this class for a real simple_salesforce / requests call when you have
-# live credentials.  The interface (create_contact / print_records) stays the same.
+# live credentials.  The interface (create_contact / create_contacts_bulk /
+# print_records / print_since) stays the same.
 # ─────────────────────────────────────────────────────────────────────────────
 
 class MockSalesforce:
@@ -53,23 +77,49 @@ class MockSalesforce:
 
     @classmethod
     def create_contact(cls, fields: dict) -> dict:
-        sf_id  = f"003{cls._seq:013d}"
-        cls._seq += 1
-        record = {
-            "Id":          sf_id,
-            "RecordType":  "WealthManagementClient",
-            "CreatedDate": datetime.utcnow().isoformat() + "Z",
-            **fields,
-        }
-        cls._records[sf_id] = record
-        return {"success": True, "id": sf_id, "errors": []}
+        return cls.create_contacts_bulk([fields])["contacts"][0]
+
+    @classmethod
+    def create_contacts_bulk(cls, records: list) -> dict:
+        """Insert many contacts in one call, like the Bulk API's Contact.insert.
+
+        Partial success: every entry gets its own result, and a bad entry fails
+        on its own without aborting the rest of the batch.
+        """
+        created = time.strftime("%Y-%m-%dT%H:%M:%SZ", time.gmtime())
+        results = []
+        for fields in records:
+            if not isinstance(fields, dict):
+                results.append({"success": False, "id": None, "errors": [{
+                    "statusCode": "INVALID_INPUT",
+                    "message":    "Each contact must be an object",
+                    "retryable":  False,
+                }]})
+                continue
+            sf_id = f"003{cls._seq:013d}"
+            cls._seq += 1
+            cls._records[sf_id] = {
+                "Id":          sf_id,
+                "RecordType":  "WealthManagementClient",
+                "CreatedDate": created,
+                **fields,
+            }
+            results.append({"success": True, "id": sf_id, "errors": []})
+        ok = sum(r["success"] for r in results)
+        return {"summary": {"created": ok, "failed": len(results) - ok},
+                "contacts": results}
 
     @classmethod
     def print_records(cls) -> None:
-        if not cls._records:
+        cls.print_since(0)
+
+    @classmethod
+    def print_since(cls, start: int) -> None:
+        """Print records created after the first ``start`` (insertion order)."""
+        if len(cls._records) <= start:
             return
         print("\n── Mock Salesforce — stored records ─────────────────────────────")
-        for rec in cls._records.values():
+        for rec in islice(cls._records.values(), start, None):
             print(json.dumps(rec, indent=2))
 
 
@@ -77,6 +127,19 @@ class MockSalesforce:
 # Dummy Data Generator
 # ─────────────────────────────────────────────────────────────────────────────
 
+def _write_workbook(path, sheets: dict) -> None:
+    """Write {sheet: {column: values}} as an .xlsx, streaming rows in write-only mode."""
+    from openpyxl import Workbook
+
+    wb = Workbook(write_only=True)
+    for name, cols in sheets.items():
+        ws = wb.create_sheet(title=name)
+        ws.append(list(cols))
+        for row in zip(*cols.values()):
+            ws.append(row)
+    wb.save(path)
+
+
 def create_dummy_data() -> None:
     """Write sample Excel files that the agent will read during the demo."""
     DATA_DIR.mkdir(exist_ok=True)
@@ -113,23 +176,22 @@ def create_dummy_data() -> None:
         ("Existing Advisor",     "None"),
         ("Referral Source",      "Business colleague"),
     ]
-    pd.DataFrame(intake_rows, columns=["Field", "Value"]).to_excel(
-        DATA_DIR / "client_intake.xlsx", sheet_name="Intake Form", index=False
-    )
+    _write_workbook(DATA_DIR / "client_intake.xlsx", {
+        "Intake Form": dict(zip(("Field", "Value"), zip(*intake_rows))),
+    })
 
     # ── Existing client data file (meeting prep) ─────────────────────────────
-    with pd.ExcelWriter(CLIENTS_DIR / "robert_thornton.xlsx", engine="openpyxl") as w:
-
+    _write_workbook(CLIENTS_DIR / "robert_thornton.xlsx", {
         # Account Summary
-        pd.DataFrame({
+        "Account Summary": {
             "Account":      ["IRA Rollover", "Brokerage Taxable", "Roth IRA",  "Joint Taxable"],
             "Account #":    ["IRA-7741",     "BRK-2293",          "RTH-0847",  "JNT-5512"],
             "Market Value": [1_245_000,       875_000,             320_000,     560_000],
             "As of Date":   ["2024-12-31"] * 4,
-        }).to_excel(w, sheet_name="Account Summary", index=False)
+        },
 
         # Distributions & Contributions YTD
-        pd.DataFrame({
+        "Distributions & Contributions": {
             "Date":        ["2024-01-15",   "2024-03-01",              "2024-06-15",   "2024-09-01",  "2024-12-01"],
             "Type":        ["Contribution", "Distribution",            "Contribution", "Distribution","Contribution"],
             "Account":     ["IRA-7741",     "BRK-2293",                "RTH-0847",     "IRA-7741",    "JNT-5512"],
@@ -141,10 +203,10 @@ def create_dummy_data() -> None:
                 "RMD Distribution",
                 "Year-End Contribution",
             ],
-        }).to_excel(w, sheet_name="Distributions & Contributions", index=False)
+        },
 
         # Tax & Realized G/L
-        pd.DataFrame({
+        "Tax & Realized GL": {
             "Category": [
                 "Est. Tax Payment Q1", "Est. Tax Payment Q2",
                 "Est. Tax Payment Q3", "Est. Tax Payment Q4",
@@ -165,19 +227,19 @@ def create_dummy_data() -> None:
                 "Tax-loss harvesting",   "Tax-loss harvesting",
                 "S&P 500 ETF",           "REIT holdings", "Bond ladder",
             ],
-        }).to_excel(w, sheet_name="Tax & Realized GL", index=False)
+        },
 
         # Beneficiaries
-        pd.DataFrame({
+        "Beneficiaries": {
             "Name":         ["Robert Thornton Jr.", "Sarah Thornton",      "Linda Thornton"],
             "Relationship": ["Son",                  "Daughter",            "Spouse"],
             "Pct":          [50,                      50,                    100],
             "Account(s)":   ["IRA-7741/RTH-0847",     "IRA-7741/RTH-0847",  "JNT-5512"],
             "DOB":          ["1998-07-12",             "2001-03-28",          "1970-09-22"],
-        }).to_excel(w, sheet_name="Beneficiaries", index=False)
+        },
 
         # Allocation
-        pd.DataFrame({
+        "Allocation": {
             "Asset Class": [
                 "US Large Cap Equity", "US Small/Mid Cap", "International Equity",
                 "Emerging Markets",    "US Core Bonds",    "High Yield Bonds",
@@ -187,21 +249,197 @@ def create_dummy_data() -> None:
             "Current %":     [32.4,  7.1, 11.8, 4.9,  24.2,  5.3,  5.8,  6.7,  1.8],
             "Market Value":  [972_000, 213_000, 354_000, 147_000, 726_000, 159_000, 174_000, 201_000, 54_000],
             "Drift":         ["+2.4%","-0.9%","-0.2%","-0.1%","-0.8%","+0.3%","+0.8%","-1.3%","-0.2%"],
-        }).to_excel(w, sheet_name="Allocation", index=False)
+        },
+    })
 
     print("Sample files created:")
     print(f"  {DATA_DIR}/client_intake.xlsx      — new client intake form")
     print(f"  {CLIENTS_DIR}/robert_thornton.xlsx — existing client data (5 sheets)")
 
 
+# ─────────────────────────────────────────────────────────────────────────────
+# Workbook cache
+# ─────────────────────────────────────────────────────────────────────────────
+
+@lru_cache(maxsize=32)
+def _read_all_sheets(path: str, mtime_ns: int) -> dict:
+    """Parse every sheet of a workbook in one pass → {sheet: [row dicts]}.
+
+    Cells are read as strings with blanks as "". Keyed on the file's mtime so
+    an edited workbook is re-read; callers must treat the result as read-only.
+    """
+    if CalamineWorkbook is not None:
+        wb = CalamineWorkbook.from_path(path)
+        return {s: _records(wb.get_sheet_by_name(s).to_python(skip_empty_area=False))
+                for s in wb.sheet_names}
+    from openpyxl import load_workbook
+
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        sheets = {}
+        for ws in wb.worksheets:
+            ws.reset_dimensions()  # stored dimensions can be stale
+            sheets[ws.title] = _records(ws.iter_rows(values_only=True))
+        return sheets
+    finally:
+        wb.close()
+
+
+# Text pandas reads as missing by default (its na_values list)
+_NA_TEXT = frozenset({
+    "", "#N/A", "#N/A N/A", "#NA", "-1.#IND", "-1.#QNAN", "-NaN", "-nan",
+    "1.#IND", "1.#QNAN", "<NA>", "N/A", "NA", "NULL", "NaN", "None", "n/a",
+    "nan", "null",
+})
+
+
+def _cell_text(v) -> str:
+    """One cell as pandas' read_excel(dtype=str).fillna("") would render it."""
+    if v is None:
+        return ""
+    if isinstance(v, float) and v.is_integer():
+        v = int(v)
+    elif type(v) is date:
+        v = datetime(v.year, v.month, v.day)
+    v = str(v)
+    return "" if v in _NA_TEXT else v
+
+
+def _records(rows) -> list:
+    """Raw sheet rows (header first) → row dicts, matching the pandas path.
+
+    Trailing blank rows and columns are dropped, ragged rows are padded, blank
+    headers become "Unnamed: <i>" and repeated headers are suffixed ".1", ".2",
+    … as pandas does.
+    """
+    rows = list(rows)
+    while rows and all(c is None or c == "" for c in rows[-1]):
+        rows.pop()
+    if not rows:
+        return []
+    width = max(next((i + 1 for i in range(len(r) - 1, -1, -1)
+                      if r[i] is not None and r[i] != ""), 0) for r in rows)
+    rows  = [tuple(r[:width]) + (None,) * (width - len(r)) for r in rows]
+    header, seen = [], {}
+    for i, h in enumerate(rows[0]):
+        if isinstance(h, float) and h.is_integer():
+            h = int(h)
+        name = f"Unnamed: {i}" if h is None or h == "" else str(h)
+        if name in seen:
+            seen[name] += 1
+            name = f"{name}.{seen[name]}"
+        seen.setdefault(name, 0)
+        header.append(name)
+    return [dict(zip(header, map(_cell_text, r))) for r in rows[1:]]
+
+
+def _workbook(path) -> dict:
+    """Cached sheets for ``path``; listing sheets warms the cache for reading them."""
+    return _read_all_sheets(str(path), os.stat(path).st_mtime_ns)
+
+
+# ─────────────────────────────────────────────────────────────────────────────
+# Tool implementations
+# The tools below are thin JSON wrappers over these.  Mock mode and the app
+# call them directly and get native objects, skipping a dumps/loads round-trip.
+# ─────────────────────────────────────────────────────────────────────────────
+
+def _list_sheets(file_path) -> list:
+    return list(_workbook(file_path))
+
+
+def _read_sheet(file_path, sheet_name: str) -> list:
+    """Row dicts for one sheet (shared with the cache — treat as read-only)."""
+    sheets = _workbook(file_path)
+    if sheet_name not in sheets:
+        raise ValueError(f"Worksheet named '{sheet_name}' not found")
+    return sheets[sheet_name]
+
+
+_SLUG_RE = re.compile(r"[^\w]+")
+_NAME_RE = re.compile(r"[^a-z0-9 ]")
+
+
+def _client_files() -> list:
+    """Client workbooks — a plain suffix check over one directory listing."""
+    try:
+        return [p for p in CLIENTS_DIR.iterdir() if p.suffix == ".xlsx"]
+    except FileNotFoundError:
+        return []
+
+
+def _find_client(client_name: str) -> dict:
+    """{found, path, sheets} for the client's workbook, or {found: False, tip, available}."""
+    name = client_name.lower()
+    slug = _SLUG_RE.sub("_", name).strip("_") + ".xlsx"
+
+    # Exact slug match — a direct stat, no directory scan
+    f = CLIENTS_DIR / slug
+    if f.is_file():
+        return {"found": True, "path": str(f), "sheets": list(_workbook(f))}
+
+    # Partial: all name parts (apostrophes stripped) somewhere in the stem
+    all_files = _client_files()
+    parts = _NAME_RE.sub("", name).split()
+    for f in all_files:
+        if all(p in f.stem for p in parts):
+            return {"found": True, "path": str(f), "sheets": list(_workbook(f))}
+
+    available = [f.stem.replace("_", " ").title() for f in all_files]
+    return {
+        "found":     False,
+        "tip":       "Run: python wealth_agent.py setup",
+        "available": available,
+    }
+
+
+# create_salesforce_contact argument → Salesforce Contact field, in record order
+_SF_FIELDS = {
+    "first_name":         "FirstName",
+    "last_name":          "LastName",
+    "email":              "Email",
+    "phone":              "Phone",
+    "date_of_birth":      "Birthdate",
+    "mailing_street":     "MailingStreet",
+    "mailing_city":       "MailingCity",
+    "mailing_state":      "MailingState",
+    "mailing_zip":        "MailingPostalCode",
+    "annual_income":      "Annual_Income__c",
+    "employer":           "AccountName",
+    "occupation":         "Title",
+    "risk_tolerance":     "Risk_Tolerance__c",
+    "investment_goal":    "Investment_Goal__c",
+    "time_horizon_years": "Time_Horizon__c",
+    "net_worth":          "Net_Worth__c",
+    "liquid_assets":      "Liquid_Assets__c",
+    "lead_source":        "LeadSource",
+    "notes":              "Description",
+}
+
+
+def _create_contact(**kwargs) -> dict:
+    """create_salesforce_contact with the same keyword arguments, minus the JSON."""
+    return MockSalesforce.create_contact(
+        {sf: kwargs.get(arg, "") for arg, sf in _SF_FIELDS.items()})
+
+
+def _create_contacts(contacts: list) -> dict:
+    """Bulk form of _create_contact; each entry uses the same argument names."""
+    return MockSalesforce.create_contacts_bulk([
+        {sf: c.get(arg, "") for arg, sf in _SF_FIELDS.items()}
+        if isinstance(c, dict) else c
+        for c in contacts
+    ])
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # Tool Definitions
-# @beta_tool generates the JSON schema from type hints + the Args: docstring.
-# Claude decides when and how to call each tool; the SDK handles the loop.
-# In mock mode these same functions are called directly, bypassing the API.
+# _run_agent wraps these with beta_tool, which generates the JSON schema from
+# type hints + the Args: docstring.  Claude decides when and how to call each
+# tool; the SDK handles the loop.  Mock mode and the app call the tool
+# implementations above directly.
 # ─────────────────────────────────────────────────────────────────────────────
 
-@beta_tool
 def list_excel_sheets(file_path: str) -> str:
     """List all sheet names in an Excel workbook.
 
@@ -209,58 +447,42 @@ def list_excel_sheets(file_path: str) -> str:
         file_path: Path to the .xlsx file (relative or absolute).
     """
     try:
-        return json.dumps({"sheets": pd.ExcelFile(file_path).sheet_names})
+        return _to_json({"sheets": _list_sheets(file_path)})
     except Exception as exc:
-        return json.dumps({"error": str(exc)})
+        return _to_json({"error": str(exc)})
 
 
-@beta_tool
-def read_excel_sheet(file_path: str, sheet_name: str) -> str:
-    """Read all rows from a named sheet in an Excel file and return them as JSON.
+def read_excel_sheet(
+    file_path: str,
+    sheet_name: str,
+    nrows: int = 0,
+    skiprows: int = 0,
+) -> str:
+    """Read rows from a named sheet in an Excel file and return them as JSON.
 
     Args:
         file_path: Path to the .xlsx file.
         sheet_name: Exact name of the sheet to read.
+        nrows: Return at most this many data rows — use it to peek at a long sheet. 0 (the default) reads every row.
+        skiprows: Number of data rows (below the header) to skip first; with nrows this pages through a long sheet.
     """
     try:
-        df = pd.read_excel(file_path, sheet_name=sheet_name, dtype=str)
-        return json.dumps(df.fillna("").to_dict(orient="records"))
+        rows = _read_sheet(file_path, sheet_name)
+        start = max(skiprows, 0)
+        return _to_json(rows[start:start + nrows] if nrows > 0 else rows[start:])
     except Exception as exc:
-        return json.dumps({"error": str(exc)})
+        return _to_json({"error": str(exc)})
 
 
-@beta_tool
 def find_client_file(client_name: str) -> str:
     """Search for a client's Excel data file by their full name.
 
     Args:
         client_name: Client full name, e.g. 'Robert Thornton'.
     """
-    slug      = re.sub(r"[^\w]+", "_", client_name.lower()).strip("_") + ".xlsx"
-    all_files = list(CLIENTS_DIR.glob("*.xlsx"))
-
-    # Exact slug match
-    for f in all_files:
-        if f.name == slug:
-            return json.dumps({"found": True, "path": str(f),
-                                "sheets": pd.ExcelFile(str(f)).sheet_names})
+    return _to_json(_find_client(client_name))
 
-    # Partial: all name parts (apostrophes stripped) somewhere in the stem
-    parts = re.sub(r"[^a-z0-9 ]", "", client_name.lower()).split()
-    for f in all_files:
-        if all(p in f.stem for p in parts):
-            return json.dumps({"found": True, "path": str(f),
-                                "sheets": pd.ExcelFile(str(f)).sheet_names})
 
-    available = [f.stem.replace("_", " ").title() for f in all_files]
-    return json.dumps({
-        "found":     False,
-        "tip":       "Run: python wealth_agent.py setup",
-        "available": available,
-    })
-
-
-@beta_tool
 def create_salesforce_contact(
     first_name: str,
     last_name: str,
@@ -305,28 +527,46 @@ def create_salesforce_contact(
         lead_source: Referral or lead source (optional).
         notes: Additional advisor notes such as beneficiary details (optional).
     """
-    result = MockSalesforce.create_contact({
-        "FirstName":          first_name,
-        "LastName":           last_name,
-        "Email":              email,
-        "Phone":              phone,
-        "Birthdate":          date_of_birth,
-        "MailingStreet":      mailing_street,
-        "MailingCity":        mailing_city,
-        "MailingState":       mailing_state,
-        "MailingPostalCode":  mailing_zip,
-        "Annual_Income__c":   annual_income,
-        "AccountName":        employer,
-        "Title":              occupation,
-        "Risk_Tolerance__c":  risk_tolerance,
-        "Investment_Goal__c": investment_goal,
-        "Time_Horizon__c":    time_horizon_years,
-        "Net_Worth__c":       net_worth,
-        "Liquid_Assets__c":   liquid_assets,
-        "LeadSource":         lead_source,
-        "Description":        notes,
-    })
-    return json.dumps(result)
+    return _to_json(_create_contact(
+        first_name         = first_name,
+        last_name          = last_name,
+        email              = email,
+        phone              = phone,
+        date_of_birth      = date_of_birth,
+        mailing_street     = mailing_street,
+        mailing_city       = mailing_city,
+        mailing_state      = mailing_state,
+        mailing_zip        = mailing_zip,
+        annual_income      = annual_income,
+        employer           = employer,
+        occupation         = occupation,
+        risk_tolerance     = risk_tolerance,
+        investment_goal    = investment_goal,
+        time_horizon_years = time_horizon_years,
+        net_worth          = net_worth,
+        liquid_assets      = liquid_assets,
+        lead_source        = lead_source,
+        notes              = notes,
+    ))
+
+
+def create_salesforce_contacts_bulk(contacts_json: str) -> str:
+    """Create several Salesforce Contact records in one batch call.
+
+    Use this instead of repeated create_salesforce_contact calls when the intake
+    form holds more than one client. Returns a per-contact result list plus a
+    created/failed summary; failed entries can be corrected and resubmitted.
+
+    Args:
+        contacts_json: JSON array of contact objects, each keyed by the same argument names as create_salesforce_contact (first_name, last_name, email, ...).
+    """
+    try:
+        contacts = json.loads(contacts_json)
+        if not isinstance(contacts, list):
+            raise ValueError("contacts_json must be a JSON array")
+    except ValueError as exc:
+        return _to_json({"error": str(exc)})
+    return _to_json(_create_contacts(contacts))
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -343,6 +583,8 @@ Your job:
    - Numeric fields (income, net worth, liquid assets) must be digits only — no $ or commas.
    - Put beneficiary details in the notes field.
 3. Call create_salesforce_contact exactly once with all extracted data.
+   If the form holds several clients, call create_salesforce_contacts_bulk once
+   with all of them instead.
 4. After the record is created, print a clean confirmation summary for the advisor."""
 
 MEETING_PREP_SYSTEM = """\
@@ -375,6 +617,9 @@ Keep it tight — one printed page."""
 
 def _run_agent(system: str, user_msg: str, tools: list, header: str) -> None:
     """Execute the tool-runner loop, print progress, and display final output."""
+    import anthropic
+    from anthropic import beta_tool
+
     client = anthropic.Anthropic()
 
     print(f"\n{'━' * 60}")
@@ -384,8 +629,11 @@ def _run_agent(system: str, user_msg: str, tools: list, header: str) -> None:
     runner = client.beta.messages.tool_runner(
         model=MODEL,
         max_tokens=8192,
-        system=system,
-        tools=tools,
+        # The breakpoint on the system block caches the tools + system prefix,
+        # so every follow-up request in the tool loop reads it from cache.
+        system=[{"type": "text", "text": system,
+                 "cache_control": {"type": "ephemeral"}}],
+        tools=[beta_tool(t) for t in tools],
         messages=[{"role": "user", "content": user_msg}],
     )
 
@@ -410,23 +658,46 @@ def _run_agent(system: str, user_msg: str, tools: list, header: str) -> None:
 # a deterministic formatter produces the output instead.
 # ─────────────────────────────────────────────────────────────────────────────
 
+_NUMERIC_STRIP = str.maketrans("", "", ",$+")
+
+
 def _safe_float(val) -> float:
     """Parse a value to float, stripping $, commas, and leading +."""
+    if isinstance(val, (int, float)) and not isinstance(val, bool):
+        return float(val)
     try:
-        return float(str(val).replace(",", "").replace("$", "").replace("+", ""))
+        return float(str(val).translate(_NUMERIC_STRIP))
     except (ValueError, TypeError):
         return 0.0
 
 
+def _num_array(rows: list, key: str, strip: str = r"[,$+]"):
+    """Parse one column of ``rows`` to a float array in a single vectorised pass.
+
+    Same cleaning as _safe_float (``strip`` is removed before parsing);
+    unparseable cells come back as NaN so callers choose the fallback.
+    """
+    import pandas as pd
+
+    col = pd.Series([r.get(key, "") for r in rows], dtype=object).astype(str)
+    return pd.to_numeric(col.str.replace(strip, "", regex=True),
+                         errors="coerce").to_numpy(dtype=float)
+
+
 def _fmt_money(val) -> str:
     """Format a number as $1,234,567 (negative → -$1,234,567)."""
     try:
-        n = _safe_float(val)
-        return f"-${abs(n):,.0f}" if n < 0 else f"${n:,.0f}"
+        return _fmt_money_float(_safe_float(val))
     except (ValueError, TypeError):
         return str(val)
 
 
+@lru_cache(maxsize=2048)
+def _fmt_money_float(n: float) -> str:
+    # Report values repeat (zeros, round amounts, totals echoed in talking points)
+    return f"-${abs(n):,.0f}" if n < 0 else f"${n:,.0f}"
+
+
 def _mock_register_client(intake_path: str) -> None:
     """Simulate Claude reading the intake form and creating a Salesforce record."""
     print(f"\n{'━' * 60}")
@@ -435,15 +706,14 @@ def _mock_register_client(intake_path: str) -> None:
 
     # Step 1: list sheets
     print(f"  → list_excel_sheets({intake_path!r})", flush=True)
-    sheets_result = json.loads(list_excel_sheets(intake_path))
-    if "error" in sheets_result:
-        sys.exit(f"Error reading {intake_path}: {sheets_result['error']}")
-    sheet = sheets_result["sheets"][0]
+    try:
+        sheet = _list_sheets(intake_path)[0]
+    except Exception as exc:
+        sys.exit(f"Error reading {intake_path}: {exc}")
 
     # Step 2: read intake form
     print(f"  → read_excel_sheet({sheet!r})", flush=True)
-    rows   = json.loads(read_excel_sheet(intake_path, sheet))
-    intake = {r["Field"]: r.get("Value", "") for r in rows}
+    intake = {r["Field"]: r.get("Value", "") for r in _read_sheet(intake_path, sheet)}
 
     # Step 3: build beneficiary notes and call create_salesforce_contact
     bene_parts = []
@@ -461,7 +731,7 @@ def _mock_register_client(intake_path: str) -> None:
     ln = intake.get("Last Name", "")
     print(f"  → create_salesforce_contact('{fn}', '{ln}', ...)", flush=True)
 
-    result = json.loads(create_salesforce_contact(
+    result = _create_contact(
         first_name         = fn,
         last_name          = ln,
         email              = intake.get("Email", ""),
@@ -481,7 +751,7 @@ def _mock_register_client(intake_path: str) -> None:
         liquid_assets      = intake.get("Liquid Assets", ""),
         lead_source        = intake.get("Referral Source", ""),
         notes              = "  |  ".join(bene_parts),
-    ))
+    )
 
     sf_id = result.get("id", "—")
 
@@ -522,7 +792,7 @@ def _mock_meeting_prep(client_name: str) -> None:
 
     # Step 1: locate client file
     print(f"  → find_client_file({client_name!r})", flush=True)
-    found = json.loads(find_client_file(client_name))
+    found = _find_client(client_name)
     if not found.get("found"):
         print("  Client not found.")
         available = found.get("available", [])
@@ -534,11 +804,11 @@ def _mock_meeting_prep(client_name: str) -> None:
     file_path = found["path"]
     sheets    = found["sheets"]
 
-    # Step 2: read every sheet
+    # Step 2: read every sheet — one parse of the workbook covers them all
     data: dict = {}
     for sheet in sheets:
         print(f"  → read_excel_sheet({sheet!r})", flush=True)
-        data[sheet] = json.loads(read_excel_sheet(file_path, sheet))
+        data[sheet] = _read_sheet(file_path, sheet)
 
     # Step 3: format and print the one-pager
     print()
@@ -548,7 +818,7 @@ def _mock_meeting_prep(client_name: str) -> None:
 def _build_one_pager(client_name: str, data: dict) -> str:
     """Format all sheet data into a clean advisor one-pager string."""
     W     = 64
-    today = datetime.now().strftime("%Y-%m-%d")
+    today = time.strftime("%Y-%m-%d")
 
     # Pre-load all sections so computed values are available across sections
     acct_rows  = data.get("Account Summary", [])
@@ -558,17 +828,24 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     alloc_rows = data.get("Allocation", [])
 
     # ── Derived values ────────────────────────────────────────────────────────
-    total_aum = sum(_safe_float(r.get("Market Value", 0)) for r in acct_rows)
+    import numpy as np
 
-    total_contrib = sum(_safe_float(r.get("Amount ($)", 0)) for r in dc_rows
-                        if _safe_float(r.get("Amount ($)", 0)) > 0)
-    total_distrib = sum(_safe_float(r.get("Amount ($)", 0)) for r in dc_rows
-                        if _safe_float(r.get("Amount ($)", 0)) < 0)
+    # Each numeric column is parsed once; the row loops below reuse the arrays.
+    acct_mv  = np.nan_to_num(_num_array(acct_rows,  "Market Value"))
+    dc_amt   = np.nan_to_num(_num_array(dc_rows,    "Amount ($)"))
+    tax_amt  = np.nan_to_num(_num_array(tax_rows,   "Amount ($)"))
+    alloc_mv = np.nan_to_num(_num_array(alloc_rows, "Market Value"))
+    drift_v  = _num_array(alloc_rows, "Drift", strip=r"[%+]")
+    drifted  = np.abs(drift_v) >= 2.0          # NaN (unparseable) → False
+
+    total_aum     = float(acct_mv.sum())
+    total_contrib = float(dc_amt[dc_amt > 0].sum())
+    total_distrib = float(dc_amt[dc_amt < 0].sum())
 
     tax_map: dict = {}
     if tax_rows:
-        tax_map = {r.get("Category", "").strip(): _safe_float(r.get("Amount ($)", 0))
-                   for r in tax_rows}
+        tax_map = {r.get("Category", "").strip(): amt
+                   for r, amt in zip(tax_rows, tax_amt.tolist())}
 
     est_taxes  = sum(v for k, v in tax_map.items() if "Est. Tax" in k)
     net_gl     = sum(v for k, v in tax_map.items() if "Realized" in k)
@@ -577,16 +854,15 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     interest   = tax_map.get("Interest Income",     0.0)
     total_inc  = qual_div + nq_div + interest
 
-    drift_flags: list = []
-    for r in alloc_rows:
-        try:
-            dval = float(r.get("Drift", "0").replace("%", "").replace("+", ""))
-            if abs(dval) >= 2.0:
-                drift_flags.append((r.get("Asset Class", ""), r.get("Drift", ""), dval))
-        except (ValueError, AttributeError):
-            pass
+    # Figures quoted in both a table and the talking points, formatted once
+    aum_str    = _fmt_money(total_aum)
+    net_gl_str = _fmt_money(net_gl)
+
+    drift_flags = [(r.get("Asset Class", ""), r.get("Drift", ""), float(dval))
+                   for r, dval, hit in zip(alloc_rows, drift_v, drifted) if hit]
 
-    rmd_rows = [r for r in dc_rows if "RMD" in r.get("Description", "")]
+    rmd_rows = [(r, amt) for r, amt in zip(dc_rows, dc_amt.tolist())
+                if "RMD" in r.get("Description", "")]
 
     # ── Builder helpers ───────────────────────────────────────────────────────
     lines: list = []
@@ -615,22 +891,20 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     if acct_rows:
         lines.append(f"  {'Account':<22} {'Acct #':<12} {'Market Value':>13}  As of")
         lines.append(f"  {'─'*22} {'─'*12} {'─'*13}  {'─'*10}")
-        for r in acct_rows:
-            mv = _safe_float(r.get("Market Value", 0))
+        for r, mv in zip(acct_rows, acct_mv.tolist()):
             lines.append(
                 f"  {r.get('Account',''):<22} {r.get('Account #',''):<12}"
                 f" {_fmt_money(mv):>13}  {r.get('As of Date','')}"
             )
         lines.append(f"  {'─'*22} {'─'*12} {'─'*13}")
-        lines.append(f"  {'TOTAL AUM':<22} {'':<12} {_fmt_money(total_aum):>13}")
+        lines.append(f"  {'TOTAL AUM':<22} {'':<12} {aum_str:>13}")
 
     # ── DISTRIBUTIONS & CONTRIBUTIONS ─────────────────────────────────────────
     section("DISTRIBUTIONS & CONTRIBUTIONS (YTD)")
     if dc_rows:
         lines.append(f"  {'Date':<12} {'Type':<14} {'Account':<10} {'Amount':>12}  Description")
         lines.append(f"  {'─'*12} {'─'*14} {'─'*10} {'─'*12}  {'─'*25}")
-        for r in dc_rows:
-            amt  = _safe_float(r.get("Amount ($)", 0))
+        for r, amt in zip(dc_rows, dc_amt.tolist()):
             sign = "+" if amt > 0 else ""
             lines.append(
                 f"  {r.get('Date',''):<12} {r.get('Type',''):<14}"
@@ -653,7 +927,7 @@ def _build_one_pager(client_name: str, data: dict) -> str:
         lines.append(f"    {'ST Losses:':<34} {_fmt_money(tax_map.get('Realized ST Losses', 0)):>12}")
         lines.append(f"    {'LT Losses:':<34} {_fmt_money(tax_map.get('Realized LT Losses', 0)):>12}")
         lines.append(f"    {'─'*47}")
-        lines.append(f"    {'Net Realized G/L:':<34} {_fmt_money(net_gl):>12}")
+        lines.append(f"    {'Net Realized G/L:':<34} {net_gl_str:>12}")
         lines.append("")
         lines.append(f"  Investment Income:")
         lines.append(f"    {'Qualified Dividends:':<34} {_fmt_money(qual_div):>12}")
@@ -679,15 +953,11 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     if alloc_rows:
         lines.append(f"  {'Asset Class':<24} {'Target':>7}  {'Current':>8}  {'Mkt Value':>12}  Drift")
         lines.append(f"  {'─'*24} {'─'*7}  {'─'*8}  {'─'*12}  {'─'*8}")
-        for r in alloc_rows:
+        for r, mv, hit in zip(alloc_rows, alloc_mv.tolist(), drifted.tolist()):
             tgt   = str(r.get("Target %",  ""))
             cur   = str(r.get("Current %", ""))
-            mv    = _safe_float(r.get("Market Value", 0))
             drift = r.get("Drift", "")
-            try:
-                flag = " ◄" if abs(float(drift.replace("%","").replace("+",""))) >= 2.0 else ""
-            except (ValueError, AttributeError):
-                flag = ""
+            flag  = " ◄" if hit else ""
             lines.append(
                 f"  {r.get('Asset Class',''):<24} {tgt+'%':>7}  {cur+'%':>8}"
                 f"  {_fmt_money(mv):>12}  {drift}{flag}"
@@ -707,8 +977,7 @@ def _build_one_pager(client_name: str, data: dict) -> str:
         )
 
     # RMD check
-    for r in rmd_rows:
-        amt = _safe_float(r.get("Amount ($)", 0))
+    for r, amt in rmd_rows:
         talking_points.append(
             f"→  RMD of {_fmt_money(amt)} taken {r.get('Date','')} from"
             f" {r.get('Account','')} — confirm tax withholding election on file"
@@ -718,7 +987,7 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     if tax_rows:
         if net_gl > 0:
             talking_points.append(
-                f"→  Net realized gain of {_fmt_money(net_gl)} YTD"
+                f"→  Net realized gain of {net_gl_str} YTD"
                 f" — coordinate with CPA before year-end"
             )
         else:
@@ -730,12 +999,11 @@ def _build_one_pager(client_name: str, data: dict) -> str:
     # AUM overview
     if acct_rows:
         talking_points.append(
-            f"→  AUM totals {_fmt_money(total_aum)} across {len(acct_rows)} accounts"
+            f"→  AUM totals {aum_str} across {len(acct_rows)} accounts"
             f" — review consolidation opportunities"
         )
 
-    for tp in talking_points:
-        lines.append(f"  {tp}")
+    lines.extend(f"  {tp}" for tp in talking_points)
 
     lines.append("")
     rule("═")
@@ -747,25 +1015,28 @@ def _build_one_pager(client_name: str, data: dict) -> str:
 # Mode: Register Client
 # ─────────────────────────────────────────────────────────────────────────────
 
-def register_client(intake_path: str, mock: bool = False) -> None:
+def register_client(intake_path: str, mock: bool = False, quiet: bool = False) -> None:
     if not Path(intake_path).exists():
         sys.exit(
             f"File not found: {intake_path}\n"
             "Run 'python wealth_agent.py setup' to create sample data."
         )
 
+    before = len(MockSalesforce._records)
     if mock:
         _mock_register_client(intake_path)
     else:
         _run_agent(
             system   = REGISTER_SYSTEM,
             user_msg = f"Register the new client from the intake form at: {intake_path}",
-            tools    = [list_excel_sheets, read_excel_sheet, create_salesforce_contact],
+            tools    = [list_excel_sheets, read_excel_sheet,
+                        create_salesforce_contact, create_salesforce_contacts_bulk],
             header   = "WEALTH AGENT — Client Registration",
         )
 
-    # Print raw Salesforce record so every mapped field is visible
-    MockSalesforce.print_records()
+    # Print the raw Salesforce record(s) from this run so every mapped field is visible
+    if not quiet:
+        MockSalesforce.print_since(before)
 
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -784,11 +1055,68 @@ def meeting_prep(client_name: str, mock: bool = False) -> None:
         )
 
 
+def _prep_one(client_name: str, mock: bool) -> None:
+    try:
+        meeting_prep(client_name, mock=mock)
+    except Exception as exc:
+        print(f"\n  Meeting prep failed for {client_name}: {exc}")
+
+
+def _prep_job(job: tuple) -> str:
+    """Worker: run one meeting prep and return everything it printed."""
+    buf = io.StringIO()
+    with redirect_stdout(buf):
+        _prep_one(*job)
+    return buf.getvalue()
+
+
+def meeting_prep_batch(names, mock: bool = False, max_workers=None) -> None:
+    """
+    Prep many clients at once across processes. A single client runs straight
+    to stdout. Otherwise each worker captures its client's brief and it is
+    printed whole as soon as that job finishes, so briefs never interleave but
+    come out in completion order rather than the order of ``names``.
+    """
+    jobs = [(name, mock) for name in names]
+    if len(jobs) < 2:
+        for job in jobs:
+            _prep_one(*job)
+        return
+    from concurrent.futures import ProcessPoolExecutor, as_completed
+
+    workers = min(max_workers or os.cpu_count() or 1, len(jobs))
+    with ProcessPoolExecutor(max_workers=workers) as pool:
+        for fut in as_completed([pool.submit(_prep_job, job) for job in jobs]):
+            sys.stdout.write(fut.result())
+            sys.stdout.flush()
+
+
+def _read_names(path: str) -> list:
+    """Client names from a text file — one per line, blanks and # comments skipped."""
+    try:
+        lines = Path(path).read_text().splitlines()
+    except FileNotFoundError:
+        sys.exit(f"File not found: {path}")
+    return [ln.strip() for ln in lines if ln.strip() and not ln.lstrip().startswith("#")]
+
+
 # ─────────────────────────────────────────────────────────────────────────────
 # CLI
 # ─────────────────────────────────────────────────────────────────────────────
 
-def main() -> None:
+_COMMANDS = {
+    "setup":        lambda args: create_dummy_data(),
+    "register":     lambda args: register_client(args.intake, mock=args.mock,
+                                                 quiet=args.quiet),
+    "meeting-prep": lambda args: meeting_prep(args.client_name, mock=args.mock),
+    "meeting-prep-batch": lambda args: meeting_prep_batch(
+        _read_names(args.names_file), mock=args.mock, max_workers=args.workers),
+}
+
+
+@lru_cache(maxsize=1)
+def _build_parser() -> argparse.ArgumentParser:
+    """The CLI parser — built once per process, parse_args() leaves it untouched."""
     parser = argparse.ArgumentParser(
         prog="wealth_agent.py",
         description="Wealth Management AI Agent — powered by Claude",
@@ -820,30 +1148,48 @@ Mock mode (no API key):
         metavar="PATH",
         help="Path to intake form (default: data/client_intake.xlsx)",
     )
+    reg.add_argument(
+        "--quiet",
+        action="store_true",
+        help="Skip the raw Salesforce record dump after registration",
+    )
 
     prep = sub.add_parser("meeting-prep", help="Generate an advisor meeting one-pager")
     prep.add_argument("client_name", help="Client full name, e.g. 'Robert Thornton'")
 
-    args = parser.parse_args()
+    batch = sub.add_parser("meeting-prep-batch",
+                           help="Generate one-pagers for many clients in parallel")
+    batch.add_argument(
+        "--names-file",
+        required=True,
+        metavar="PATH",
+        help="Text file with one client full name per line",
+    )
+    batch.add_argument(
+        "--workers",
+        type=int,
+        default=None,
+        metavar="N",
+        help="Worker processes (default: one per CPU, capped at the client count)",
+    )
+    return parser
+
+
+def main() -> None:
+    parser = _build_parser()
+    args   = parser.parse_args()
 
     if not args.cmd:
         parser.print_help()
         return
 
-    if args.cmd == "setup":
-        create_dummy_data()
-        return
-
-    if not args.mock and not os.getenv("ANTHROPIC_API_KEY"):
+    if args.cmd != "setup" and not args.mock and not os.getenv("ANTHROPIC_API_KEY"):
         sys.exit(
             "Error: ANTHROPIC_API_KEY environment variable is not set.\n"
             "Tip: run with --mock to test without an API key."
         )
 
-    if args.cmd == "register":
-        register_client(args.intake, mock=args.mock)
-    elif args.cmd == "meeting-prep":
-        meeting_prep(args.client_name, mock=args.mock)
+    _COMMANDS[args.cmd](args)
 
 
 if __name__ == "__main__":